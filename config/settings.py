@@ -2,8 +2,11 @@
 Centralized configuration settings for the QA automation project.
 """
 import os
+import json
+import uuid
+import tempfile
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Dict, Any, List
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,10 +18,13 @@ class Settings:
     """Application settings loaded from environment variables."""
     
     # Base Configuration
+    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "dev")
     BASE_URL: str = os.getenv("BASE_URL", "https://demoqa.com")
     TIMEOUT: int = int(os.getenv("TIMEOUT", "10"))
     BROWSER: str = os.getenv("BROWSER", "chrome")
     HEADLESS: bool = os.getenv("HEADLESS", "false").lower() == "true"
+    # normal | eager | none; empty means the environment JSON value (default normal)
+    PAGE_LOAD_STRATEGY: str = os.getenv("PAGE_LOAD_STRATEGY", "")
     
     # Screenshot Configuration
     SCREENSHOT_PATH: str = os.getenv("SCREENSHOT_PATH", "reports/screenshots")
@@ -31,14 +37,48 @@ class Settings:
     # Test Configuration
     PARALLEL_WORKERS: int = int(os.getenv("PARALLEL_WORKERS", "4"))
     RETRY_COUNT: int = int(os.getenv("RETRY_COUNT", "2"))
+    DRIVER_POOL_SIZE: int = int(os.getenv("DRIVER_POOL_SIZE", "2"))
+    # Records pre-generated per type for test_data/user_data; 0 generates on the test thread
+    DATA_POOL_SIZE: int = int(os.getenv("DATA_POOL_SIZE", "16"))
+    BDD_BROWSER_SCOPE: str = os.getenv("BDD_BROWSER_SCOPE", "feature")
+    # deeplink opens target pages by URL; ui clicks through the home cards (see utils/routes.py)
+    NAVIGATION_MODE: str = os.getenv("NAVIGATION_MODE", "deeplink")
+    DRIVER_CACHE_FILE: str = os.getenv(
+        "DRIVER_CACHE_FILE", os.path.join(os.path.expanduser("~"), ".wdm", "qa-driver-cache.json")
+    )
     
     # API Configuration
     API_BASE_URL: str = os.getenv("API_BASE_URL", "https://demoqa.com/api")
     API_TIMEOUT: int = int(os.getenv("API_TIMEOUT", "30"))
+    API_CONNECT_TIMEOUT: float = float(os.getenv("API_CONNECT_TIMEOUT", "5"))
+    # Connections kept alive per host; 0 sizes the pool to the worker concurrency
+    API_POOL_SIZE: int = int(os.getenv("API_POOL_SIZE", "0"))
+    API_RETRIES: int = int(os.getenv("API_RETRIES", "3"))
+    API_BACKOFF_FACTOR: float = float(os.getenv("API_BACKOFF_FACTOR", "0.3"))
+    # Longest wait between retries; a longer Retry-After ends the retries instead
+    API_MAX_RETRY_DELAY: float = float(os.getenv("API_MAX_RETRY_DELAY", "10"))
+    # Book Store accounts shared by the whole run (see utils/account_pool.py)
+    ACCOUNT_POOL_SIZE: int = int(os.getenv("ACCOUNT_POOL_SIZE", "8"))
+    ACCOUNT_POOL_BOOKS: int = int(os.getenv("ACCOUNT_POOL_BOOKS", "2"))
+    ACCOUNT_POOL_DIR: str = os.getenv("ACCOUNT_POOL_DIR", os.path.join(tempfile.gettempdir(), "qa-account-pool"))
+    
+    # Local DemoQA stand-in (utils/demoqa_stub) instead of the real site
+    USE_LOCAL_STUB: bool = os.getenv("USE_LOCAL_STUB", "false").lower() == "true"
+    
+    # Request blocking (patterns come from config/environments/<ENVIRONMENT>.json)
+    BLOCK_REQUESTS: bool = os.getenv("BLOCK_REQUESTS", "true").lower() == "true"
     
     # Logging
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    # Bounded log queue; records beyond it are dropped and counted instead of blocking tests
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    # Interaction logging: all | sample | aggregate (per-test counts and timings only)
+    INTERACTION_LOG_MODE: str = os.getenv("INTERACTION_LOG_MODE", "sample")
+    # Comma-separated event=rate pairs, e.g. "element_interaction=0.1,assertion=1"
+    INTERACTION_SAMPLE_RATES: str = os.getenv("INTERACTION_SAMPLE_RATES", "element_interaction=0.1,assertion=1")
+    # Maximum logged events per second for each event type
+    INTERACTION_LOG_RATE_LIMIT: int = int(os.getenv("INTERACTION_LOG_RATE_LIMIT", "50"))
     
     # Specific URLs
     @property
@@ -65,6 +105,52 @@ class Settings:
     def PROFILE_URL(self) -> str:
         return f"{self.BASE_URL}/profile"
     
+    @property
+    def BLOCKED_URL_PATTERNS(self) -> List[str]:
+        """URL patterns blocked through CDP; empty when blocking is disabled."""
+        config = self.get_environment_config()
+        if not self.BLOCK_REQUESTS or not config.get("block_requests", False):
+            return []
+        return config.get("blocked_url_patterns", [])
+    
+    def get_environment_config(self) -> Dict[str, Any]:
+        """Load config/environments/<ENVIRONMENT>.json."""
+        path = os.path.join(os.path.dirname(__file__), "environments", f"{self.ENVIRONMENT}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def get_interaction_sample_rates(self) -> Dict[str, float]:
+        """Sampling rate per interaction event type, parsed from INTERACTION_SAMPLE_RATES."""
+        rates = {}
+        for pair in self.INTERACTION_SAMPLE_RATES.split(","):
+            if "=" in pair:
+                event, rate = pair.split("=", 1)
+                rates[event.strip()] = min(max(float(rate), 0.0), 1.0)
+        return rates
+    
+    def get_worker_id(self) -> str:
+        """pytest-xdist worker (gw0, gw1...), run_parallel shard (shard0...) or "master"."""
+        return os.getenv("PYTEST_XDIST_WORKER") or os.getenv("BDD_WORKER_ID") or "master"
+    
+    def get_run_id(self) -> str:
+        """Id of the current run, inherited by xdist workers and run_parallel shards."""
+        return os.environ.setdefault("QA_RUN_ID", uuid.uuid4().hex)
+    
+    def get_page_load_strategy(self) -> str:
+        """Page-load strategy from the environment variable or the environment JSON."""
+        strategy = self.PAGE_LOAD_STRATEGY or self.get_environment_config().get("page_load_strategy", "normal")
+        if strategy not in ("normal", "eager", "none"):
+            raise ValueError(f"Unsupported page load strategy: {strategy}")
+        return strategy
+    
+    def use_base_url(self, base_url: str) -> None:
+        """Point the site and API URLs at another host, e.g. the local stand-in."""
+        self.BASE_URL = base_url.rstrip("/")
+        self.API_BASE_URL = f"{self.BASE_URL}/api"
+    
     def get_browser_options(self) -> Dict[str, Any]:
         """Get browser-specific options."""
         options = {
@@ -99,7 +185,10 @@ class Settings:
             elif self.BROWSER == "edge":
                 options["edge"]["args"].append("--headless")
         
-        return options.get(self.BROWSER, {})
+        browser_options = options.get(self.BROWSER, {})
+        if browser_options:
+            browser_options["page_load_strategy"] = self.get_page_load_strategy()
+        return browser_options
 
 
 # Global settings instance
@@ -2,42 +2,127 @@
 Environment configuration for Behave BDD tests
 """
 import os
+import sys
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
 
+# Garante que os módulos do projeto (config, utils) sejam importáveis pelo behave
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-def before_all(context):
-    """Setup before all tests."""
-    # Create necessary directories
-    os.makedirs("reports/screenshots", exist_ok=True)
-    os.makedirs("reports/allure-results", exist_ok=True)
-    os.makedirs("reports/html-reports", exist_ok=True)
+from config.settings import settings
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import resolve_chromedriver
+from utils.request_blocking import request_blocker
+from utils.routes import Router
+from utils.screenshots import screenshot_writer
+from utils.logger import get_logger
 
+logger = get_logger(__name__)
 
-def before_scenario(context, scenario):
-    """Setup before each scenario."""
-    # Setup Chrome driver
+
+def setup_chrome_driver():
+    """Setup Chrome WebDriver. Only the hooks below create or quit drivers."""
     chrome_options = Options()
     chrome_options.add_argument("--start-maximized")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-blink-features=AutomationControlled")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option('useAutomationExtension', False)
+    chrome_options.page_load_strategy = settings.get_page_load_strategy()
+    request_blocker.configure_options(chrome_options)
+    
+    service = Service(resolve_chromedriver())
+    driver = webdriver.Chrome(service=service, options=chrome_options)
     
-    service = Service(ChromeDriverManager().install())
-    context.driver = webdriver.Chrome(service=service, options=chrome_options)
+    # Block ads and trackers before the first page load
+    request_blocker.apply(driver)
     
     # Execute script to remove webdriver property
-    context.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    return driver
+
+
+def _start_browser(context):
+    """Start a single-driver pool; the driver is reset, not relaunched, between scenarios."""
+    context.driver_pool = DriverPool(setup_chrome_driver, size=1).start()
+
+
+def before_all(context):
+    """Setup before all tests."""
+    # Create necessary directories
+    os.makedirs("reports/screenshots", exist_ok=True)
+    os.makedirs("reports/allure-results", exist_ok=True)
+    os.makedirs("reports/html-reports", exist_ok=True)
+    
+    # Local DemoQA stand-in (USE_LOCAL_STUB), one per behave process
+    context.demoqa_stub = None
+    if settings.USE_LOCAL_STUB:
+        from utils.demoqa_stub import DemoQAStubServer
+        context.demoqa_stub = DemoQAStubServer().start()
+        settings.use_base_url(context.demoqa_stub.url)
+    
+    # One browser per process or per feature (BDD_BROWSER_SCOPE)
+    context.browser_scope = "process" if settings.BDD_BROWSER_SCOPE.lower() == "process" else "feature"
+    if context.browser_scope == "process":
+        _start_browser(context)
+
+
+def before_feature(context, feature):
+    """Setup before each feature."""
+    if context.browser_scope == "feature":
+        _start_browser(context)
+
+
+def before_scenario(context, scenario):
+    """Setup before each scenario."""
+    context.driver = context.driver_pool.acquire()
+    # Scenarios tagged @ui_navigation keep the click-through path covered
+    mode = "ui" if "ui_navigation" in scenario.effective_tags else None
+    context.router = Router(context.driver, mode)
 
 
 def after_scenario(context, scenario):
     """Cleanup after each scenario."""
-    if hasattr(context, 'driver'):
-        context.driver.quit()
+    # before_scenario failed to get a driver; behave already reports that error
+    if getattr(context, "driver", None) is None:
+        return
+    try:
+        request_blocker.collect(context.driver)
+        logger.log_interaction_summary(scenario.name)
+        # Seeded Book Store state (common_steps): stop the localStorage injection and delete the user.
+        # The seeding step may have failed part-way, so each piece is optional.
+        seeder = getattr(context, "state_seeder", None)
+        if seeder:
+            try:
+                seed_script = getattr(context, "seed_script", None)
+                if seed_script:
+                    seeder.clear(context.driver, seed_script)
+                account = getattr(context, "seeded_account", None)
+                if account:
+                    seeder.delete_account(account)
+            finally:
+                seeder.close()
+    finally:
+        # Windows, cookies and storage are cleared before the next scenario;
+        # always hand the driver back, or the next acquire waits out its timeout
+        context.driver_pool.release(context.driver)
+
+
+def after_feature(context, feature):
+    """Cleanup after each feature."""
+    if context.browser_scope == "feature":
+        context.driver_pool.shutdown()
 
 
 def after_all(context):
     """Cleanup after all tests."""
-    pass
+    request_blocker.report()
+    screenshot_writer.close()
+    if context.browser_scope == "process":
+        context.driver_pool.shutdown()
+    if context.demoqa_stub:
+        context.demoqa_stub.stop()
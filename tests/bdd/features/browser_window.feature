@@ -1,5 +1,6 @@
 Feature: Validação de nova janela no DemoQA
 
+  @ui_navigation
   Scenario: Abrir nova janela e verificar mensagem
     Given que o usuário acessa o site DemoQA
     When ele navega até "Alerts, Frame & Windows"
@@ -0,0 +1,7 @@
+Feature: Perfil do usuário na Book Store do DemoQA
+
+  Scenario: Acessar o perfil já autenticado com livros alugados
+    Given que o usuário está autenticado via API com 2 livros
+    When ele acessa a página de perfil
+    Then o perfil deve exibir o nome do usuário
+    And o perfil deve listar 2 livros
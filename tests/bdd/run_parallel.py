@@ -0,0 +1,152 @@
+"""
+Parallel runner for the Behave BDD suite.
+
+Each shard (a feature file or a single scenario) runs in its own behave
+process with its own browser; outputs and exit codes are merged afterwards.
+
+Usage:
+    python -m tests.bdd.run_parallel
+    python -m tests.bdd.run_parallel --shard scenario --workers 8
+"""
+import os
+import re
+import sys
+import glob
+import json
+import time
+import argparse
+import subprocess
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any
+
+from config.settings import settings
+from utils.logger import get_logger
+from utils.request_blocking import merge_reports
+
+logger = get_logger(__name__)
+
+FEATURES_DIR = os.path.join("tests", "bdd", "features")
+OUTPUT_DIR = os.path.join("reports", "bdd-parallel")
+SCENARIO_PATTERN = re.compile(r"^\s*(Scenario|Scenario Outline|Cenário|Esquema do Cenário):")
+
+
+def collect_shards(features_dir: str = FEATURES_DIR, shard: str = "feature") -> List[str]:
+    """List behave locations to run: feature files, or feature:line per scenario."""
+    features = sorted(glob.glob(os.path.join(features_dir, "*.feature")))
+    if shard == "feature":
+        return features
+
+    shards = []
+    for feature in features:
+        with open(feature, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, start=1):
+                if SCENARIO_PATTERN.match(line):
+                    shards.append(f"{feature}:{line_number}")
+    return shards
+
+
+def _shard_name(location: str) -> str:
+    """File-system friendly name for a shard."""
+    return re.sub(r"[^\w.-]", "_", os.path.basename(location))
+
+
+def run_shard(location: str, shard_index: int) -> Dict[str, Any]:
+    """Run one shard in a dedicated behave process."""
+    name = _shard_name(location)
+    pretty_file = os.path.join(OUTPUT_DIR, f"{name}.txt")
+    json_file = os.path.join(OUTPUT_DIR, f"{name}.json")
+
+    command = [
+        sys.executable, "-m", "behave", location,
+        "--no-capture", "--no-color",
+        "-f", "pretty", "-o", pretty_file,
+        "-f", "json", "-o", json_file,
+    ]
+    # Allure results from every shard land in the same directory and merge naturally
+    if importlib.util.find_spec("allure_behave"):
+        command += ["-f", "allure_behave.formatter:AllureFormatter", "-o", settings.ALLURE_RESULTS_DIR]
+
+    # Unique per shard (settings.get_worker_id), so per-process outputs never share a file name
+    env = dict(os.environ, BDD_WORKER_ID=f"shard{shard_index}", BDD_BROWSER_SCOPE="process")
+    start = time.perf_counter()
+    completed = subprocess.run(command, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    duration = time.perf_counter() - start
+
+    logger.info(f"Shard {location} finished with exit code {completed.returncode} in {duration:.2f}s")
+    return {
+        "location": location,
+        "returncode": completed.returncode,
+        "duration": duration,
+        "pretty_file": pretty_file,
+        "json_file": json_file,
+        "console": completed.stdout
+    }
+
+
+def merge_results(results: List[Dict[str, Any]]) -> int:
+    """Merge shard outputs into single reports and return the overall exit code."""
+    pretty_path = os.path.join(OUTPUT_DIR, "behave_pretty.txt")
+    json_path = os.path.join(OUTPUT_DIR, "behave.json")
+    merged_features = []
+
+    with open(pretty_path, 'w', encoding='utf-8') as pretty:
+        for result in results:
+            pretty.write(f"# {result['location']} (exit code {result['returncode']})\n")
+            if os.path.exists(result["pretty_file"]):
+                with open(result["pretty_file"], 'r', encoding='utf-8') as f:
+                    pretty.write(f.read())
+            else:
+                pretty.write(result["console"])
+            pretty.write("\n")
+
+            try:
+                with open(result["json_file"], 'r', encoding='utf-8') as f:
+                    merged_features.extend(json.load(f))
+            except (OSError, ValueError):
+                logger.warning(f"No JSON output for shard {result['location']}")
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(merged_features, f, indent=2, ensure_ascii=False)
+
+    failed = [r["location"] for r in results if r["returncode"] != 0]
+    logger.info(f"Merged {len(results)} shards into {pretty_path} and {json_path}")
+    if failed:
+        logger.error(f"Failed shards: {failed}")
+        return 1
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the BDD suite across a pool of behave processes."""
+    parser = argparse.ArgumentParser(description="Run behave features in parallel")
+    parser.add_argument("--workers", type=int, default=settings.PARALLEL_WORKERS,
+                        help="number of concurrent behave processes")
+    parser.add_argument("--shard", choices=["feature", "scenario"], default="feature",
+                        help="unit of work handed to each process")
+    parser.add_argument("--features-dir", default=FEATURES_DIR)
+    args = parser.parse_args(argv)
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    os.makedirs(settings.ALLURE_RESULTS_DIR, exist_ok=True)
+
+    shards = collect_shards(args.features_dir, args.shard)
+    if not shards:
+        logger.warning(f"No features found in {args.features_dir}")
+        return 0
+
+    # Set before the shards start so they all inherit it (screenshot index, account pool)
+    settings.get_run_id()
+    workers = max(1, min(args.workers, len(shards)))
+    logger.info(f"Running {len(shards)} shards on {workers} workers")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run_shard, shards, range(len(shards))))
+    logger.info(f"Parallel BDD run took {time.perf_counter() - start:.2f}s")
+
+    merge_reports()
+    return merge_results(results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
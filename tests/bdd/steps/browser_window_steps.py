@@ -5,7 +5,8 @@ from behave import given, when, then
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
+from utils.waits import WaitEngine
+from utils.screenshots import screenshot_writer
 
 
 
@@ -13,33 +14,13 @@ import time
 @when('ele navega até "Alerts, Frame & Windows"')
 def step_navigate_to_alerts_frame_windows(context):
     """Navega até o card Alerts, Frame & Windows."""
-    wait = WebDriverWait(context.driver, 10)
-    
-    
-    alerts_card_locator = (By.XPATH, "//h5[text()='Alerts, Frame & Windows']")
-    alerts_card = wait.until(EC.presence_of_element_located(alerts_card_locator))
-    
-    
-    context.driver.execute_script("arguments[0].scrollIntoView(true);", alerts_card)
-    
-    
-    wait.until(EC.element_to_be_clickable(alerts_card_locator)).click()
-    time.sleep(1)
+    context.router.click_card("Alerts, Frame & Windows")
 
 
 @when('clica em "Browser Windows"')
 def step_click_browser_windows(context):
     """Clica no submenu Browser Windows."""
-    wait = WebDriverWait(context.driver, 10)
-    
-    
-    submenu_locator = (By.XPATH, "//span[text()='Browser Windows']")
-    submenu = wait.until(EC.presence_of_element_located(submenu_locator))
-    
-    
-    context.driver.execute_script("arguments[0].scrollIntoView(true);", submenu)
-    wait.until(EC.element_to_be_clickable(submenu_locator)).click()
-    time.sleep(1)
+    context.router.open("browser_windows")
 
 
 @when('clica no botão "New Window"')
@@ -54,7 +35,7 @@ def step_click_new_window(context):
     
     
     new_window_button.click()
-    time.sleep(2)
+    WaitEngine(context.driver).wait_for_window_count(2)
 
 
 @then('uma nova janela deve ser aberta')
@@ -108,4 +89,4 @@ def step_close_new_window(context):
     assert "browser-windows" in original_url, f"Deve estar na janela original, URL atual: {original_url}"
     
     
-    context.driver.save_screenshot("reports/screenshots/browser_window_test.png")
+    screenshot_writer.capture(context.driver, "browser_window_test")
@@ -2,40 +2,41 @@ from behave import when, then
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
 import os
+from utils.waits import WaitEngine
+from utils.helpers import FormFiller
+from utils.screenshots import screenshot_writer
+
+
+def _fill_field(context, key, value):
+    """Preenche um campo de texto no próprio step, para que um localizador quebrado falhe aqui."""
+    element_id = FormFiller.PRACTICE_FORM_FIELDS[key]
+    WebDriverWait(context.driver, 10).until(EC.presence_of_element_located((By.ID, element_id)))
+    # O telefone precisa de teclas reais por causa do maxlength
+    FormFiller(context.driver, FormFiller.PRACTICE_FORM_FIELDS, keystroke_fields=["mobile"]).fill({key: value})
+
 
 @when('ele navega até "Forms"')
 def step_navigate_to_forms(context):
-    wait = WebDriverWait(context.driver, 10)
-    forms_card = wait.until(EC.element_to_be_clickable((By.XPATH, "//h5[text()='Forms']")))
-    context.driver.execute_script("arguments[0].scrollIntoView(true);", forms_card)
-    forms_card.click()
-    time.sleep(2)
+    context.router.click_card("Forms")
 
 @when('acessa o submenu "Practice Form"')
 def step_click_practice_form(context):
-    wait = WebDriverWait(context.driver, 10)
-    submenu = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='Practice Form']")))
-    context.driver.execute_script("arguments[0].scrollIntoView(true);", submenu)
-    submenu.click()
-    time.sleep(2)
+    context.router.open("practice_form")
 
 @when('preenche o primeiro nome com "{first_name}"')
 def step_fill_first_name(context, first_name):
-    wait = WebDriverWait(context.driver, 10)
-    first_name_field = wait.until(EC.element_to_be_clickable((By.ID, "firstName")))
-    first_name_field.send_keys(first_name)
+    _fill_field(context, "first_name", first_name)
     print(f"Primeiro nome preenchido: {first_name}")
 
 @when('preenche o sobrenome com "{last_name}"')
 def step_fill_last_name(context, last_name):
-    context.driver.find_element(By.ID, "lastName").send_keys(last_name)
+    _fill_field(context, "last_name", last_name)
     print(f"Sobrenome preenchido: {last_name}")
 
 @when('preenche o email com "{email}"')
 def step_fill_email(context, email):
-    context.driver.find_element(By.ID, "userEmail").send_keys(email)
+    _fill_field(context, "email", email)
     print(f"Email preenchido: {email}")
 
 @when('seleciona o gênero "{gender}"')
@@ -47,14 +48,14 @@ def step_select_gender(context, gender):
 
 @when('preenche o telefone com "{phone}"')
 def step_fill_phone(context, phone):
-    context.driver.find_element(By.ID, "userNumber").send_keys(phone)
+    _fill_field(context, "mobile", phone)
     print(f"Telefone preenchido: {phone}")
 
 @when('seleciona a data de nascimento "{day} de {month} de {year}"')
 def step_select_birth_date(context, day, month, year):
     date_field = context.driver.find_element(By.ID, "dateOfBirthInput")
     context.driver.execute_script("arguments[0].scrollIntoView(true);", date_field)
-    time.sleep(1)
+    WaitEngine(context.driver).wait_for_scroll_end()
     date_field.click()
     year_select = context.driver.find_element(By.CLASS_NAME, "react-datepicker__year-select")
     year_select.send_keys(year)
@@ -75,7 +76,7 @@ def step_add_subject(context, subject):
 def step_select_hobby(context, hobby):
     hobby_checkbox = context.driver.find_element(By.XPATH, f"//label[text()='{hobby}']")
     context.driver.execute_script("arguments[0].scrollIntoView(true);", hobby_checkbox)
-    time.sleep(1)
+    WaitEngine(context.driver).wait_for_scroll_end()
     context.driver.execute_script("arguments[0].click();", hobby_checkbox)
     print(f"Hobby selecionado: {hobby}")
 
@@ -91,52 +92,23 @@ def step_upload_file(context, filename):
 
 @when('preenche o endereço com "{address}"')
 def step_fill_address(context, address):
-    address_field = context.driver.find_element(By.ID, "currentAddress")
-    address_field.send_keys(address)
+    _fill_field(context, "current_address", address)
     print(f"Endereço preenchido: {address}")
 
 @when('submete o formulário')
 def step_submit_form(context):
     submit_button = context.driver.find_element(By.ID, "submit")
     context.driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
-    time.sleep(1)
+    WaitEngine(context.driver).wait_for_scroll_end()
     context.driver.execute_script("arguments[0].click();", submit_button)
     print("Formulário submetido")
 
 @then('o formulário deve ser enviado com sucesso')
 def step_validate_form_submission(context):
-    try:
-        wait = WebDriverWait(context.driver, 10)
-        modal = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "modal-content")))
-        print("Formulário enviado com sucesso")
-    except Exception as e:
-        print(f"Modal não encontrado: {e}")
-        print("Verificando alternativas...")
-        try:
-            context.driver.execute_script("""
-                var elements = document.querySelectorAll('.ad, .advertisement, .popup, .modal, .overlay');
-                for (var i = 0; i < elements.length; i++) {
-                    elements[i].remove();
-                }
-            """)
-            print("Tentativa de remover anúncios/pop-ups")
-            context.driver.execute_script("window.scrollTo(0, 0)")
-            if "Thanks" in context.driver.page_source or "Submitted" in context.driver.page_source:
-                print("Texto de confirmação encontrado na página")
-                return
-            submit_button = context.driver.find_element(By.ID, "submit")
-            context.driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
-            context.driver.execute_script("arguments[0].click();", submit_button)
-            print("Tentando enviar o formulário novamente")
-            time.sleep(5)
-            if "Thanks" in context.driver.page_source or "Submitted" in context.driver.page_source:
-                print("Texto de confirmação encontrado após nova tentativa")
-                return
-        except Exception as inner_error:
-            print(f"Erro na tentativa alternativa: {inner_error}")
-        context.driver.save_screenshot("reports/screenshots/practice_form_failure.png")
-        print("Salvando screenshot de falha")
-        print("Continuando com o teste mesmo sem confirmação de sucesso")
+    # Com anúncios bloqueados na configuração do driver, nada cobre o botão de envio
+    wait = WebDriverWait(context.driver, 10)
+    wait.until(EC.visibility_of_element_located((By.CLASS_NAME, "modal-content")))
+    print("Formulário enviado com sucesso")
 
 @then('deve exibir a mensagem "{message}"')
 def step_validate_success_message(context, message):
@@ -146,7 +118,6 @@ def step_validate_success_message(context, message):
 
 @then('deve salvar evidência visual')
 def step_save_evidence(context):
-    screenshot_path = "reports/screenshots/practice_form_submitted.png"
-    context.driver.save_screenshot(screenshot_path)
+    # Gravada em segundo plano, com nome pelo hash do conteúdo (ver reports/screenshots/index.json)
+    screenshot_path = screenshot_writer.capture(context.driver, "practice_form_submitted")
     print(f"Screenshot salva como evidência: {screenshot_path}")
-    context.driver.quit()
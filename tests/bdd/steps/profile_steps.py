@@ -0,0 +1,31 @@
+from behave import when, then
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+
+@when('ele acessa a página de perfil')
+def step_open_profile(context):
+    # Sessão já injetada: abre o perfil direto, sem passar pelo login
+    context.router.go("profile")
+
+@then('o perfil deve exibir o nome do usuário')
+def step_validate_profile_user(context):
+    wait = WebDriverWait(context.driver, 10)
+    username = context.seeded_account.username
+    wait.until(EC.text_to_be_present_in_element((By.ID, "userName-value"), username))
+    print(f"Usuário autenticado no perfil: {username}")
+
+@then('o perfil deve listar {quantidade:d} livros')
+def step_validate_profile_books(context, quantidade):
+    # A tabela do DemoQA completa com linhas vazias; contam só as linhas com título
+    titles = {book["title"] for book in context.seeded_account.books}
+    WebDriverWait(context.driver, 10).until(
+        lambda driver: len([row for row in driver.find_elements(By.CSS_SELECTOR, ".rt-tbody .rt-tr-group")
+                            if row.text.strip()]) >= quantidade
+    )
+    rows = [row.text for row in context.driver.find_elements(By.CSS_SELECTOR, ".rt-tbody .rt-tr-group")
+            if row.text.strip()]
+    assert len(rows) == quantidade, f"Esperados {quantidade} livros no perfil, encontrados: {rows}"
+    for title in titles:
+        assert any(title in row for row in rows), f"Livro '{title}' não aparece no perfil: {rows}"
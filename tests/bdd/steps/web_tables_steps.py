@@ -2,39 +2,53 @@ from behave import when, then
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from utils.helpers import FormFiller, TableSnapshot
+from utils.screenshots import screenshot_writer
+
+
+def _record_data(first, last, email, age, salary, department):
+    """Monta o registro no formato de DataGenerator.generate_web_table_test_data()."""
+    return {
+        "firstName": first,
+        "lastName": last,
+        "email": email,
+        "age": age,
+        "salary": salary,
+        "department": department
+    }
+
 
 @when('ele clica em "Elements"')
 def step_click_elements(context):
-    wait = WebDriverWait(context.driver, 10)
-    element = wait.until(EC.presence_of_element_located((By.XPATH, "//h5[text()='Elements']")))
-    context.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-    element.click()
+    context.router.click_card("Elements")
 
 @when('acessa o submenu "Web Tables"')
 def step_click_web_tables(context):
-    wait = WebDriverWait(context.driver, 10)
-    submenu = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='Web Tables']")))
-    context.driver.execute_script("arguments[0].scrollIntoView(true);", submenu)
-    submenu.click()
+    context.router.open("web_tables")
 
 @when('cria um novo registro com os dados "{first}", "{last}", "{email}", "{age}", "{salary}", "{department}"')
 def step_create_record(context, first, last, email, age, salary, department):
     wait = WebDriverWait(context.driver, 10)
     add_button = wait.until(EC.element_to_be_clickable((By.ID, "addNewRecordButton")))
     context.driver.execute_script("arguments[0].scrollIntoView(true);", add_button)
+    context.table_before = TableSnapshot.capture(context.driver)
     add_button.click()
 
-    wait.until(EC.visibility_of_element_located((By.ID, "firstName"))).send_keys(first)
-    context.driver.find_element(By.ID, "lastName").send_keys(last)
-    context.driver.find_element(By.ID, "userEmail").send_keys(email)
-    context.driver.find_element(By.ID, "age").send_keys(age)
-    context.driver.find_element(By.ID, "salary").send_keys(salary)
-    context.driver.find_element(By.ID, "department").send_keys(department)
+    wait.until(EC.visibility_of_element_located((By.ID, "firstName")))
+    FormFiller(context.driver, FormFiller.WEB_TABLE_FIELDS).fill(
+        _record_data(first, last, email, age, salary, department)
+    )
 
     submit_button = context.driver.find_element(By.ID, "submit")
     context.driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
     context.driver.execute_script("arguments[0].click();", submit_button)
 
+    snapshot = TableSnapshot.capture(context.driver)
+    change = snapshot.diff(context.table_before)
+    assert change["kind"] == "create", f"Esperada a criação de um registro, diferença: {change}"
+    assert snapshot.contains("Email", email), f"Registro {email} não encontrado na tabela"
+    context.table_before = snapshot
+
 @when('edita o registro criado para "{first}", "{last}", "{email}", "{age}", "{salary}", "{department}"')
 def step_edit_record(context, first, last, email, age, salary, department):
     edit_button = context.driver.find_element(By.XPATH, "//span[@title='Edit']")
@@ -42,27 +56,25 @@ def step_edit_record(context, first, last, email, age, salary, department):
     edit_button.click()
 
     wait = WebDriverWait(context.driver, 10)
-    wait.until(EC.visibility_of_element_located((By.ID, "firstName"))).clear()
-    context.driver.find_element(By.ID, "firstName").send_keys(first)
-    context.driver.find_element(By.ID, "lastName").clear()
-    context.driver.find_element(By.ID, "lastName").send_keys(last)
-    context.driver.find_element(By.ID, "userEmail").clear()
-    context.driver.find_element(By.ID, "userEmail").send_keys(email)
-    context.driver.find_element(By.ID, "age").clear()
-    context.driver.find_element(By.ID, "age").send_keys(age)
-    context.driver.find_element(By.ID, "salary").clear()
-    context.driver.find_element(By.ID, "salary").send_keys(salary)
-    context.driver.find_element(By.ID, "department").clear()
-    context.driver.find_element(By.ID, "department").send_keys(department)
+    wait.until(EC.visibility_of_element_located((By.ID, "firstName")))
+    # O setter nativo substitui o valor atual, dispensando o clear()
+    FormFiller(context.driver, FormFiller.WEB_TABLE_FIELDS).fill(
+        _record_data(first, last, email, age, salary, department)
+    )
 
     submit_button = context.driver.find_element(By.ID, "submit")
     context.driver.execute_script("arguments[0].scrollIntoView(true);", submit_button)
     context.driver.execute_script("arguments[0].click();", submit_button)
+    context.edited_record = _record_data(first, last, email, age, salary, department)
 
 @then('o registro editado deve estar visível')
 def step_validate_edited_record(context):
-    table = context.driver.find_element(By.CLASS_NAME, "rt-table")
-    assert "QA Sênior" in table.text
+    snapshot = TableSnapshot.capture(context.driver)
+    change = snapshot.diff(context.table_before)
+    assert change["kind"] == "edit", f"Esperada a edição de um registro, diferença: {change}"
+    rows = snapshot.find("Email", context.edited_record["email"])
+    assert rows and rows[0]["Last Name"] == context.edited_record["lastName"], f"Registro editado não encontrado: {rows}"
+    context.table_before = snapshot
 
 @when('exclui o registro criado')
 def step_delete_record(context):
@@ -73,7 +85,9 @@ def step_delete_record(context):
 @then('o registro não deve mais estar visível')
 def step_validate_deletion(context):
     wait = WebDriverWait(context.driver, 10)
-    table = wait.until(EC.presence_of_element_located((By.CLASS_NAME, "rt-table")))
-    assert "Pandora" not in table.text
-    context.driver.save_screenshot("evidencia_web_tables.png")
-    context.driver.quit()
\ No newline at end of file
+    wait.until(EC.presence_of_element_located((By.CLASS_NAME, "rt-table")))
+    snapshot = TableSnapshot.capture(context.driver)
+    change = snapshot.diff(context.table_before)
+    assert change["kind"] == "delete", f"Esperada a exclusão de um registro, diferença: {change}"
+    assert not snapshot.contains("First Name", "Pandora"), "Registro excluído ainda está na tabela"
+    screenshot_writer.capture(context.driver, "evidencia_web_tables")
\ No newline at end of file
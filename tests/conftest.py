@@ -2,7 +2,8 @@
 Pytest configuration and fixtures for the QA automation project.
 """
 import os
-import sys
+import re
+import json
 import pytest
 import allure
 import logging
@@ -13,13 +14,19 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
 from webdriver_manager.firefox import GeckoDriverManager
 from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
 from config.settings import settings
 from utils.logger import get_logger
 from utils.helpers import PerformanceHelper
+from utils.driver_pool import DriverPool
+from utils.driver_resolver import resolve_chromedriver
+from utils.request_blocking import request_blocker
+from utils.screenshots import screenshot_writer
+from utils.session_metrics import session_metrics
+from utils.account_pool import account_pool
+from utils.data_generator import record_pool
 
 logger = get_logger(__name__)
 
@@ -58,47 +65,63 @@ def pytest_runtest_makereport(item, call):
     outcome = yield
     rep = outcome.get_result()
     
-    if rep.when == "call" and rep.failed:
-        # Take screenshot on failure
-        if hasattr(item, "funcargs") and "browser" in item.funcargs:
-            browser = item.funcargs["browser"]
+    # Expose rep_setup/rep_call/rep_teardown on the item and count the outcome
+    setattr(item, f"rep_{rep.when}", rep)
+    if rep.when == "call":
+        session_metrics.record_outcome(rep.outcome, rep.duration)
+    elif rep.when == "setup" and not rep.passed:
+        session_metrics.record_outcome("skipped" if rep.skipped else "error", rep.duration)
+    elif rep.when == "teardown" and rep.failed:
+        # Reported by pytest as an error on top of the call outcome; the duration is already counted
+        session_metrics.record_outcome("error")
+    
+    if rep.when == "call" and rep.failed and settings.SCREENSHOT_ON_FAILURE:
+        # One capture per failure; the PNG is written by the background writer
+        funcargs = getattr(item, "funcargs", {})
+        browser = funcargs.get("browser") or funcargs.get("browser_function")
+        if browser:
             try:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                screenshot_name = f"failure_{item.name}_{timestamp}.png"
-                screenshot_path = os.path.join(settings.SCREENSHOT_PATH, screenshot_name)
-                browser.save_screenshot(screenshot_path)
+                screenshot_path, png = screenshot_writer.capture_png(browser, f"failure_{item.name}_{timestamp}")
                 
-                # Attach to Allure report
-                allure.attach(
-                    browser.get_screenshot_as_png(),
-                    name="screenshot",
-                    attachment_type=allure.attachment_type.PNG
-                )
+                # Allure gets the image itself so the report stays portable;
+                # the HTML report links the content-addressed file next to it
+                allure.attach(png, name="screenshot", attachment_type=allure.attachment_type.PNG)
+                pytest_html = item.config.pluginmanager.getplugin("html")
+                if pytest_html:
+                    extras = getattr(rep, "extras", [])
+                    extras.append(pytest_html.extras.url(
+                        os.path.relpath(screenshot_path, settings.HTML_REPORTS_DIR), name="screenshot"
+                    ))
+                    rep.extras = extras
                 
-                logger.error(f"Screenshot saved: {screenshot_path}")
+                logger.error(f"Screenshot queued: {screenshot_path}")
             except Exception as e:
                 logger.error(f"Failed to take screenshot: {e}")
 
 
+@pytest.fixture(scope="session", autouse=True)
+def demoqa_stub():
+    """Local DemoQA stand-in on an ephemeral port, enabled with USE_LOCAL_STUB."""
+    if not settings.USE_LOCAL_STUB:
+        yield None
+        return
+    
+    from utils.demoqa_stub import DemoQAStubServer
+    server = DemoQAStubServer().start()
+    original_urls = (settings.BASE_URL, settings.API_BASE_URL)
+    settings.use_base_url(server.url)
+    yield server
+    settings.BASE_URL, settings.API_BASE_URL = original_urls
+    server.stop()
+
+
 @pytest.fixture(scope="session")
 def browser():
     """Session-scoped browser fixture."""
     driver = None
     try:
-        # Setup browser based on configuration
-        if settings.BROWSER.lower() == "chrome":
-            driver = _setup_chrome_driver()
-        elif settings.BROWSER.lower() == "firefox":
-            driver = _setup_firefox_driver()
-        elif settings.BROWSER.lower() == "edge":
-            driver = _setup_edge_driver()
-        else:
-            raise ValueError(f"Unsupported browser: {settings.BROWSER}")
-        
-        # Configure driver
-        driver.maximize_window()
-        driver.implicitly_wait(settings.TIMEOUT)
-        
+        driver = _create_driver()
         logger.info(f"Browser {settings.BROWSER} initialized successfully")
         yield driver
         
@@ -107,39 +130,47 @@ def browser():
         raise
     finally:
         if driver:
+            request_blocker.collect(driver)
             driver.quit()
             logger.info("Browser closed")
 
 
+@pytest.fixture(scope="session")
+def driver_pool():
+    """Per-worker pool of warm drivers backing browser_function."""
+    pool = DriverPool(_create_driver, implicit_wait=settings.TIMEOUT).start()
+    yield pool
+    pool.shutdown()
+
+
 @pytest.fixture(scope="function")
-def browser_function():
+def browser_function(driver_pool):
     """Function-scoped browser fixture for isolated tests."""
-    driver = None
-    try:
-        # Setup browser based on configuration
-        if settings.BROWSER.lower() == "chrome":
-            driver = _setup_chrome_driver()
-        elif settings.BROWSER.lower() == "firefox":
-            driver = _setup_firefox_driver()
-        elif settings.BROWSER.lower() == "edge":
-            driver = _setup_edge_driver()
-        else:
-            raise ValueError(f"Unsupported browser: {settings.BROWSER}")
-        
-        # Configure driver
-        driver.maximize_window()
-        driver.implicitly_wait(settings.TIMEOUT)
-        
-        logger.info(f"Browser {settings.BROWSER} initialized for function")
-        yield driver
-        
-    except Exception as e:
-        logger.error(f"Failed to initialize browser: {e}")
-        raise
-    finally:
-        if driver:
-            driver.quit()
-            logger.info("Browser closed for function")
+    driver = driver_pool.acquire()
+    logger.info(f"Browser {settings.BROWSER} acquired from pool for function")
+    yield driver
+    request_blocker.collect(driver)
+    # Reset happens in the pool's background thread
+    driver_pool.release(driver)
+    logger.info("Browser returned to pool for function")
+
+
+def _create_driver():
+    """Create and configure a WebDriver for the configured browser."""
+    # Setup browser based on configuration
+    if settings.BROWSER.lower() == "chrome":
+        driver = _setup_chrome_driver()
+    elif settings.BROWSER.lower() == "firefox":
+        driver = _setup_firefox_driver()
+    elif settings.BROWSER.lower() == "edge":
+        driver = _setup_edge_driver()
+    else:
+        raise ValueError(f"Unsupported browser: {settings.BROWSER}")
+    
+    # Configure driver
+    driver.maximize_window()
+    driver.implicitly_wait(settings.TIMEOUT)
+    return driver
 
 
 def _setup_chrome_driver():
@@ -150,110 +181,21 @@ def _setup_chrome_driver():
     browser_options = settings.get_browser_options()
     for arg in browser_options.get("args", []):
         options.add_argument(arg)
+    options.page_load_strategy = browser_options.get("page_load_strategy", "normal")
     
     # Additional Chrome options
     options.add_argument("--disable-blink-features=AutomationControlled")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    request_blocker.configure_options(options)
     
-    # Setup service - use direct chromedriver binary instead of relying on ChromeDriverManager
-    try:
-        # Get ChromeDriver using the Manager
-        from webdriver_manager.chrome import ChromeDriverManager
-        
-        # Get the installation path but don't use it directly
-        install_path = ChromeDriverManager().install()
-        logger.info(f"ChromeDriverManager reported install path: {install_path}")
-        
-        # Special handling for macOS - sometimes the binary name is different
-        binary_path = None
-        parent_dir = os.path.dirname(install_path)
-        
-        # Diagnostic log
-        logger.info(f"Looking for chromedriver binary in directory: {parent_dir}")
-        try:
-            dir_contents = os.listdir(parent_dir)
-            logger.info(f"Directory contents: {dir_contents}")
-        except Exception as e:
-            logger.error(f"Failed to list directory contents: {e}")
-        
-        # Verification function for binary
-        def is_executable_binary(path):
-            if not os.path.isfile(path):
-                return False
-                
-            # For MacOS/Linux - check file header for executable
-            try:
-                if sys.platform != 'win32':
-                    # Check if file is executable
-                    if not os.access(path, os.X_OK):
-                        os.chmod(path, 0o755)  # Make executable
-                        
-                    # Simple file header check (first 4 bytes of valid binary)
-                    with open(path, 'rb') as f:
-                        header = f.read(4)
-                        # Common executable headers: ELF for Linux, MZ for Windows, Mach-O for Mac
-                        valid_headers = [b'\x7fELF', b'MZ', b'\xca\xfe\xba\xbe', b'\xce\xfa\xed\xfe']
-                        return any(header.startswith(h) for h in valid_headers)
-                else:
-                    # On Windows just check the extension
-                    return path.lower().endswith('.exe')
-            except Exception as e:
-                logger.error(f"Binary verification error for {path}: {e}")
-                return False
-        
-        # Search strategy:
-        # 1. Look for chromedriver directly (standard name)
-        exact_match = os.path.join(parent_dir, 'chromedriver')
-        if os.path.isfile(exact_match) and is_executable_binary(exact_match):
-            binary_path = exact_match
-            logger.info(f"Found chromedriver at exact path: {binary_path}")
-        
-        # 2. On macOS check for chromedriver_mac64 or similar variants
-        elif sys.platform == 'darwin':
-            mac_patterns = ['chromedriver_mac64', 'chromedriver_mac_arm64', 'chromedriver-mac']
-            for pattern in mac_patterns:
-                for file in os.listdir(parent_dir):
-                    if pattern in file.lower() and is_executable_binary(os.path.join(parent_dir, file)):
-                        binary_path = os.path.join(parent_dir, file)
-                        logger.info(f"Found chromedriver macOS variant: {binary_path}")
-                        break
-        
-        # 3. Find any executable that contains 'chromedriver' but exclude notice files
-        if not binary_path:
-            for file in os.listdir(parent_dir):
-                file_lower = file.lower()
-                # Skip common non-binary files
-                if any(exclude in file_lower for exclude in ['license', 'notice', 'third_party', 'readme', '.txt']):
-                    continue
-                
-                # Look for chromedriver in name
-                if 'chromedriver' in file_lower:
-                    candidate = os.path.join(parent_dir, file)
-                    if is_executable_binary(candidate):
-                        binary_path = candidate
-                        logger.info(f"Found chromedriver by name pattern: {binary_path}")
-                        break
-        
-        # 4. Last resort - create direct driver with ChromeDriverManager
-        if not binary_path:
-            logger.info("No suitable chromedriver binary found, creating service directly with ChromeDriverManager")
-            from selenium.webdriver.chrome.service import Service as ChromeService
-            service = ChromeService(ChromeDriverManager().install())
-        else:
-            # Make sure binary is executable
-            if sys.platform != 'win32':
-                os.chmod(binary_path, 0o755)
-            service = Service(binary_path)
-        
-    except Exception as e:
-        logger.error(f"Error during chromedriver setup: {e}", exc_info=True)
-        # Last attempt - try direct ChromeDriverManager
-        logger.info("Trying fallback with direct ChromeDriverManager...")
-        service = Service(ChromeDriverManager().install())
+    # Setup service - resolved once per browser version and cached on disk
+    service = Service(resolve_chromedriver())
     
     # Create driver
     driver = webdriver.Chrome(service=service, options=options)
+    # Block ads and trackers before the first page load
+    request_blocker.apply(driver)
     # Execute script to remove webdriver property
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
@@ -268,6 +210,7 @@ def _setup_firefox_driver():
     browser_options = settings.get_browser_options()
     for arg in browser_options.get("args", []):
         options.add_argument(arg)
+    options.page_load_strategy = browser_options.get("page_load_strategy", "normal")
     
     # Setup service
     service = Service(GeckoDriverManager().install())
@@ -286,6 +229,7 @@ def _setup_edge_driver():
     browser_options = settings.get_browser_options()
     for arg in browser_options.get("args", []):
         options.add_argument(arg)
+    options.page_load_strategy = browser_options.get("page_load_strategy", "normal")
     
     # Setup service
     service = Service(EdgeChromiumDriverManager().install())
@@ -297,37 +241,81 @@ def _setup_edge_driver():
 
 
 @pytest.fixture(scope="function")
-def performance_helper():
+def performance_helper(request):
     """Performance helper fixture."""
     helper = PerformanceHelper()
     yield helper
-    # Log final metrics
-    metrics = helper.get_metrics()
-    if metrics:
-        logger.info(f"Performance metrics: {metrics}")
+    # Log final metrics and export the histograms
+    if helper.histograms:
+        logger.info(f"Performance metrics: {helper.summary()}")
+        file_name = re.sub(r"[^\w.-]", "_", request.node.name)
+        helper.export_json(os.path.join("reports", "performance", f"{file_name}.json"), test=request.node.nodeid)
+        session_metrics.add_performance(helper)
+
+
+def _pooled_record(request, kind: str):
+    """Take a pre-generated record; its seed is kept on the test to replay the data."""
+    seed, record = record_pool.take(kind)
+    request.node.user_properties.append((f"{kind}_data_seed", seed))
+    logger.debug(f"{request.node.name} uses {kind} data seed {seed}")
+    return record
 
 
 @pytest.fixture(scope="function")
-def test_data():
+def test_data(request):
     """Test data fixture."""
-    from utils.data_generator import data_generator
-    return data_generator.generate_form_data()
+    return _pooled_record(request, "form")
 
 
 @pytest.fixture(scope="function")
-def user_data():
+def user_data(request):
     """User data fixture."""
-    from utils.data_generator import data_generator
-    return data_generator.generate_user_data()
+    return _pooled_record(request, "user")
 
 
 @pytest.fixture(scope="function")
 def api_helper():
     """API helper fixture."""
     from utils.helpers import APIHelper
-    return APIHelper()
+    helper = APIHelper()
+    yield helper
+    # Request latencies join the session metrics
+    session_metrics.add_performance(helper.performance)
+    helper.close()
+
+
+
+
+@pytest.fixture(scope="function")
+def seeded_account():
+    """Account API user with a token and two rented books, deleted afterwards."""
+    from utils.state_seeding import StateSeeder
+    seeder = StateSeeder()
+    try:
+        account = seeder.create_account(book_count=2)
+        yield account
+        seeder.delete_account(account)
+    finally:
+        seeder.close()
+
+
+@pytest.fixture(scope="function")
+def leased_account():
+    """Account leased from the session pool; its books are restored when returned."""
+    account = account_pool.acquire()
+    yield account
+    account_pool.release(account)
 
 
+@pytest.fixture(scope="function")
+def authenticated_browser(browser_function, leased_account):
+    """Pooled browser already logged in as a leased account, before its first page load."""
+    from utils.state_seeding import StateSeeder
+    seeder = StateSeeder()
+    identifier = seeder.inject(browser_function, leased_account)
+    yield browser_function
+    seeder.clear(browser_function, identifier)
+    seeder.close()
 
 
 @pytest.fixture(autouse=True)
@@ -341,6 +329,9 @@ def test_logger(request):
     
     yield test_logger
     
+    # Aggregated interaction counts (INTERACTION_LOG_MODE=aggregate)
+    test_logger.log_interaction_summary(test_name)
+    
     # Log test end
     test_logger.log_test_end(test_name, "completed")
 
@@ -409,16 +400,41 @@ def pytest_sessionstart(session):
     logger.info(f"Running {test_count} tests")
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist controller hook: merge the metrics a worker shipped on shutdown."""
+    workeroutput = getattr(node, "workeroutput", {})
+    data = workeroutput.get("qa_session_metrics")
+    if data:
+        session_metrics.merge_dict(json.loads(data))
+    blocking = workeroutput.get("qa_request_blocking")
+    if blocking:
+        request_blocker.merge(json.loads(blocking))
+
+
 def pytest_sessionfinish(session, exitstatus):
     """Session finish hook."""
     logger.info(f"Test session finished with exit status: {exitstatus}")
+    screenshot_writer.close()
+    record_pool.close()
+    # The controller (or a lone process) deletes the pooled accounts once every worker is done
+    account_pool.shutdown(delete_accounts=not hasattr(session.config, "workerinput") or not account_pool.shared)
     
-    # Generate summary if items are available
-    if hasattr(session, 'items') and session.items:
-        passed = len([item for item in session.items if hasattr(item, 'rep_call') and item.rep_call.passed])
-        failed = len([item for item in session.items if hasattr(item, 'rep_call') and item.rep_call.failed])
-        skipped = len([item for item in session.items if hasattr(item, 'rep_call') and item.rep_call.skipped])
-        
-        logger.info(f"Test Summary: {passed} passed, {failed} failed, {skipped} skipped")
-    else:
-        logger.info("Test session completed")
+    # xdist worker: hand outcomes and histograms to the controller, which writes the summary
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["qa_session_metrics"] = json.dumps(session_metrics.to_dict())
+        session.config.workeroutput["qa_request_blocking"] = json.dumps(request_blocker.stats)
+        return
+    
+    # The controller's own counters are zero; it reports what the workers shipped
+    request_blocker.report()
+    
+    summary = session_metrics.write()
+    session_metrics.write_allure_environment(summary)
+    outcomes = summary["outcomes"]
+    logger.info(
+        f"Test Summary: {outcomes.get('passed', 0)} passed, {outcomes.get('failed', 0)} failed, "
+        f"{outcomes.get('skipped', 0)} skipped, {outcomes.get('error', 0)} errors "
+        f"across {summary['workers']} workers; {summary['throughput_tests_per_s']} tests/s, "
+        f"p90 {summary['test_duration']['p90_ms']} ms"
+    )
@@ -0,0 +1,227 @@
+"""
+Locust load test for the DemoQA Account and BookStore APIs.
+
+Each simulated user follows the Postman collection flow: create an account,
+generate a token, confirm authorization, then list, add and remove books,
+and finally delete the account. Load grows in steps so the point where
+latency or errors take off is visible per step.
+
+Usage:
+    locust --config tests/performance/locust.conf
+    locust --config tests/performance/locust.conf --local-stub
+    locust --config tests/performance/locust.conf --step-users 20 --max-users 200 --max-p95-ms 800
+
+Writes reports/locust/bookstore_*.csv (Locust's CSV stats) and
+reports/locust/bookstore_summary.json (per-endpoint percentiles, per-step
+throughput and the threshold verdict). The exit code is 1 when the p95 or
+error-rate threshold is exceeded.
+"""
+import os
+import sys
+import json
+import math
+import random
+from typing import Dict, Any, List, Optional
+from locust import HttpUser, LoadTestShape, between, events, task
+from locust.runners import WorkerRunner
+
+# Make project modules (config, utils) importable; locust only adds this file's directory
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from config.settings import settings
+from utils.data_generator import data_generator
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+OUTPUT_DIR = os.path.join("reports", "locust")
+SUMMARY_FILE = os.path.join(OUTPUT_DIR, "bookstore_summary.json")
+
+_stub = None
+_step_snapshots: List[Dict[str, Any]] = []
+
+
+@events.init_command_line_parser.add_listener
+def _add_arguments(parser):
+    parser.add_argument("--local-stub", action="store_true", default=False,
+                        help="Run against the local DemoQA stand-in")
+    parser.add_argument("--step-users", type=int, env_var="LOCUST_STEP_USERS", default=10,
+                        help="Users added at each load step")
+    parser.add_argument("--step-time", type=int, env_var="LOCUST_STEP_TIME", default=30,
+                        help="Seconds per load step")
+    parser.add_argument("--max-users", type=int, env_var="LOCUST_MAX_USERS", default=100,
+                        help="User count of the last step")
+    parser.add_argument("--max-p95-ms", type=float, env_var="LOCUST_MAX_P95_MS", default=1000.0,
+                        help="Fail the run when the aggregated p95 exceeds this")
+    parser.add_argument("--max-error-rate", type=float, env_var="LOCUST_MAX_ERROR_RATE", default=0.01,
+                        help="Fail the run when the failure ratio exceeds this")
+
+
+@events.init.add_listener
+def _on_init(environment, **kwargs):
+    """Point the run at the local stand-in when requested; default to settings.BASE_URL."""
+    global _stub
+    options = environment.parsed_options
+    if options and options.local_stub:
+        from utils.demoqa_stub import DemoQAStubServer
+        _stub = DemoQAStubServer().start()
+        environment.host = _stub.url
+    elif not environment.host:
+        environment.host = settings.BASE_URL
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    logger.info(f"Load testing {environment.host}")
+
+
+class BookStoreUser(HttpUser):
+    """A DemoQA account renting and returning books."""
+
+    wait_time = between(0.5, 2)
+
+    def on_start(self):
+        """Create an account, generate its token and confirm it is authorized."""
+        self.account = data_generator.generate_bookstore_account()
+        self.user_id: Optional[str] = None
+        self.owned: List[str] = []
+        self.catalog: List[str] = []
+
+        with self.client.post("/Account/v1/User", json=self.account, catch_response=True) as response:
+            if response.status_code != 201:
+                response.failure(f"Create user returned {response.status_code}")
+                return
+            self.user_id = response.json()["userID"]
+
+        with self.client.post("/Account/v1/GenerateToken", json=self.account, catch_response=True) as response:
+            token = response.json().get("token") if response.status_code == 200 else None
+            if not token:
+                response.failure("No token generated")
+                self.user_id = None
+                return
+            self.client.headers["Authorization"] = f"Bearer {token}"
+
+        self.client.post("/Account/v1/Authorized", json=self.account)
+
+    @task(5)
+    def list_books(self):
+        with self.client.get("/BookStore/v1/Books", catch_response=True) as response:
+            if response.status_code == 200:
+                self.catalog = [book["isbn"] for book in response.json().get("books", [])]
+            else:
+                response.failure(f"List books returned {response.status_code}")
+
+    @task(2)
+    def add_book(self):
+        available = [isbn for isbn in self.catalog if isbn not in self.owned]
+        if not self.user_id or not available:
+            return
+        isbn = random.choice(available)
+        payload = {"userId": self.user_id, "collectionOfIsbns": [{"isbn": isbn}]}
+        with self.client.post("/BookStore/v1/Books", json=payload, catch_response=True) as response:
+            if response.status_code == 201:
+                self.owned.append(isbn)
+            else:
+                response.failure(f"Add book returned {response.status_code}")
+
+    @task(2)
+    def remove_book(self):
+        if not self.user_id or not self.owned:
+            return
+        isbn = self.owned.pop(random.randrange(len(self.owned)))
+        with self.client.delete("/BookStore/v1/Book", json={"isbn": isbn, "userId": self.user_id},
+                                catch_response=True) as response:
+            if response.status_code != 204:
+                response.failure(f"Remove book returned {response.status_code}")
+
+    @task(1)
+    def user_details(self):
+        if not self.user_id:
+            return
+        self.client.get(f"/Account/v1/User/{self.user_id}", name="/Account/v1/User/[id]")
+
+    def on_stop(self):
+        """Delete the account so repeated runs do not pile up users."""
+        if self.user_id:
+            self.client.delete(f"/Account/v1/User/{self.user_id}", name="/Account/v1/User/[id]")
+
+
+class StepLoadShape(LoadTestShape):
+    """Adds --step-users every --step-time seconds up to --max-users, then stops."""
+
+    def tick(self):
+        options = self.runner.environment.parsed_options
+        run_time = self.get_run_time()
+        step = int(run_time // options.step_time)
+        steps = math.ceil(options.max_users / options.step_users)
+        if step >= steps:
+            self._snapshot(steps)
+            return None
+        if step > len(_step_snapshots):
+            self._snapshot(step)
+        users = min((step + 1) * options.step_users, options.max_users)
+        return users, options.step_users
+
+    def _snapshot(self, step: int) -> None:
+        """Record throughput and current latency at the end of each step."""
+        while len(_step_snapshots) < step:
+            total = self.runner.environment.stats.total
+            options = self.runner.environment.parsed_options
+            _step_snapshots.append({
+                "step": len(_step_snapshots) + 1,
+                "users": min((len(_step_snapshots) + 1) * options.step_users, options.max_users),
+                "rps": round(total.current_rps, 2),
+                "current_p95_ms": total.get_current_response_time_percentile(0.95),
+                "fail_ratio": round(total.fail_ratio, 4)
+            })
+
+
+def _entry_summary(entry) -> Dict[str, Any]:
+    """Latency percentiles and counts of one Locust stats entry."""
+    return {
+        "requests": entry.num_requests,
+        "failures": entry.num_failures,
+        "rps": round(entry.total_rps, 2),
+        "p50_ms": entry.get_response_time_percentile(0.5),
+        "p95_ms": entry.get_response_time_percentile(0.95),
+        "p99_ms": entry.get_response_time_percentile(0.99),
+        "max_ms": entry.max_response_time
+    }
+
+
+@events.quitting.add_listener
+def _check_thresholds(environment, **kwargs):
+    """Apply the p95 and error-rate thresholds and write the JSON summary."""
+    # Workers only hold partial stats; the master (or a local run) decides
+    if isinstance(environment.runner, WorkerRunner):
+        return
+    options = environment.parsed_options
+    total = environment.stats.total
+    p95 = total.get_response_time_percentile(0.95) or 0
+    violations = []
+    if p95 > options.max_p95_ms:
+        violations.append(f"p95 {p95} ms > {options.max_p95_ms} ms")
+    if total.fail_ratio > options.max_error_rate:
+        violations.append(f"error rate {total.fail_ratio:.2%} > {options.max_error_rate:.2%}")
+
+    summary = {
+        "host": environment.host,
+        "thresholds": {"max_p95_ms": options.max_p95_ms, "max_error_rate": options.max_error_rate},
+        "passed": not violations,
+        "violations": violations,
+        "total": _entry_summary(total),
+        "endpoints": {f"{method} {name}": _entry_summary(entry)
+                      for (name, method), entry in sorted(environment.stats.entries.items())},
+        "steps": _step_snapshots
+    }
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    with open(SUMMARY_FILE, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2)
+
+    if violations:
+        logger.error(f"Load test thresholds exceeded: {'; '.join(violations)}")
+        environment.process_exit_code = 1
+    else:
+        logger.info(f"Load test passed: p95 {p95} ms, error rate {total.fail_ratio:.2%}")
+
+    if _stub:
+        _stub.stop()
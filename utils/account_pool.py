@@ -0,0 +1,186 @@
+"""
+Session-wide pool of Book Store accounts, leased to tests across xdist workers.
+
+The first lease of a run creates ACCOUNT_POOL_SIZE accounts concurrently and
+writes them to a JSON lease table guarded by a file lock, so every worker
+process draws from the same accounts. Acquiring an account is then a table
+lookup instead of the create user / generate token / add books chain;
+released accounts get their original books back, and the process that owns
+the run deletes them all at session end.
+"""
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
+from typing import Dict, Any, List, Optional
+from config.settings import settings
+from utils.file_lock import file_lock
+from utils.logger import get_logger
+from utils.state_seeding import SeededAccount, StateSeeder
+
+logger = get_logger(__name__)
+
+
+class AccountPool:
+    """File-locked lease table of pre-provisioned accounts for one test run."""
+
+    def __init__(self, size: int = None, book_count: int = None, run_id: str = None,
+                 directory: str = None, seeder: StateSeeder = None):
+        """Initialize the pool for a run; nothing is created until the first acquire."""
+        self.size = max(1, size or settings.ACCOUNT_POOL_SIZE)
+        self.book_count = settings.ACCOUNT_POOL_BOOKS if book_count is None else book_count
+        self.run_id = run_id or settings.get_run_id()
+        self.worker_id = settings.get_worker_id()
+        # The local stand-in keeps accounts in its own process memory, so each worker pools its own
+        self.shared = not settings.USE_LOCAL_STUB
+        table_name = self.run_id if self.shared else f"{self.run_id}-{self.worker_id}"
+        # Holds passwords and tokens, so it stays out of reports/ (uploaded as a CI artifact)
+        directory = directory or settings.ACCOUNT_POOL_DIR
+        self.table_file = os.path.join(directory, f"{table_name}.json")
+        self.lock_file = f"{self.table_file}.lock"
+        self._seeder = seeder
+        self.stats = {"provisioned": 0, "acquired": 0, "grown": 0, "resets": 0}
+
+    @property
+    def seeder(self) -> StateSeeder:
+        """API client, created on first use so it picks up the final BASE_URL."""
+        if self._seeder is None:
+            self._seeder = StateSeeder()
+        return self._seeder
+
+    def _load(self) -> Optional[Dict[str, Any]]:
+        """Read the lease table; call with the lock held."""
+        if not os.path.exists(self.table_file):
+            return None
+        with open(self.table_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _save(self, table: Dict[str, Any]) -> None:
+        """Atomically replace the lease table; call with the lock held."""
+        tmp_file = f"{self.table_file}.{os.getpid()}.tmp"
+        # Readable by the owner only
+        with os.fdopen(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+            json.dump(table, f, indent=2)
+        os.replace(tmp_file, self.table_file)
+
+    def _create(self, table: Dict[str, Any], count: int) -> List[Dict[str, Any]]:
+        """
+        Create accounts concurrently, add them to the table and return their entries.
+
+        A creation that fails after its user exists deletes that user itself
+        (StateSeeder.create_account rolls back); the accounts that were fully
+        created are still saved to the table, so shutdown deletes them, before
+        the error is raised. Call with the lock held.
+        """
+        isbns = None
+        if self.book_count:
+            catalog = self.seeder.api.get("/BookStore/v1/Books").json()["books"]
+            isbns = [book["isbn"] for book in catalog[:self.book_count]]
+
+        created = []
+        error = None
+        with ThreadPoolExecutor(max_workers=min(count, settings.PARALLEL_WORKERS * 2)) as executor:
+            futures = [executor.submit(self.seeder.create_account, isbns=isbns) for _ in range(count)]
+            for future in as_completed(futures):
+                try:
+                    created.append(dict(asdict(future.result()), leased_by=None))
+                except Exception as e:
+                    error = error or e
+        table["accounts"].extend(created)
+        if error:
+            self._save(table)
+            logger.error(f"Created {len(created)} of {count} pooled accounts: {error}")
+            raise error
+        return created
+
+    def acquire(self) -> SeededAccount:
+        """Lease a free account, provisioning the pool on the run's first call."""
+        with file_lock(self.lock_file):
+            table = self._load()
+            if table is None:
+                table = {"run_id": self.run_id, "accounts": []}
+                self._create(table, self.size)
+                self.stats["provisioned"] += self.size
+                logger.info(f"Provisioned {self.size} pooled accounts for run {self.run_id}")
+
+            entry = next((e for e in table["accounts"] if e["leased_by"] is None), None)
+            if entry is None:
+                # More concurrent leases than accounts: grow rather than make tests wait
+                entry = self._create(table, 1)[0]
+                self.stats["grown"] += 1
+                logger.warning(f"Account pool exhausted, grew to {len(table['accounts'])} accounts")
+
+            entry["leased_by"] = self.worker_id
+            self._save(table)
+
+        self.stats["acquired"] += 1
+        return self._account(entry)
+
+    def release(self, account: SeededAccount) -> None:
+        """Restore the account's original books and return it to the pool."""
+        try:
+            self._reset_books(account)
+        except Exception as e:
+            # Keep a dirty account out of circulation; it is still deleted at session end
+            logger.error(f"Could not reset pooled account {account.username}, retiring it: {e}")
+            return
+
+        with file_lock(self.lock_file):
+            table = self._load()
+            if table is None:
+                return
+            for entry in table["accounts"]:
+                if entry["user_id"] == account.user_id:
+                    entry["leased_by"] = None
+            self._save(table)
+
+    def _reset_books(self, account: SeededAccount) -> None:
+        """Put back the books the account was provisioned with, if a test changed them."""
+        headers = {"Authorization": f"Bearer {account.token}"}
+        expected = [book["isbn"] for book in account.books]
+        current = self.seeder.api.get(f"/Account/v1/User/{account.user_id}", headers=headers).json()["books"]
+        if sorted(book["isbn"] for book in current) == sorted(expected):
+            return
+
+        self.stats["resets"] += 1
+        self.seeder.api.delete(f"/BookStore/v1/Books?UserId={account.user_id}", headers=headers)
+        if expected:
+            response = self.seeder.api.post(
+                "/BookStore/v1/Books",
+                {"userId": account.user_id, "collectionOfIsbns": [{"isbn": isbn} for isbn in expected]},
+                headers=headers
+            )
+            if response.status_code != 201:
+                raise RuntimeError(f"add books returned {response.status_code}")
+
+    def shutdown(self, delete_accounts: bool = False) -> None:
+        """
+        Close API connections; the run's owner also deletes every account and the table.
+
+        With the local stand-in each worker owns its table and only removes
+        the file, since the accounts went away with the stand-in.
+        """
+        if delete_accounts:
+            with file_lock(self.lock_file):
+                table = self._load()
+                if table is not None and table["accounts"] and self.shared:
+                    accounts = [self._account(entry) for entry in table["accounts"]]
+                    with ThreadPoolExecutor(max_workers=min(len(accounts), settings.PARALLEL_WORKERS * 2)) as executor:
+                        deleted = sum(executor.map(self.seeder.delete_account, accounts))
+                    logger.info(f"Deleted {deleted} of {len(accounts)} pooled accounts for run {self.run_id}")
+                if table is not None:
+                    os.remove(self.table_file)
+            if os.path.exists(self.lock_file):
+                os.remove(self.lock_file)
+        if self._seeder is not None:
+            logger.info(f"Account pool closed for worker {self.worker_id}: {self.stats}")
+            self._seeder.close()
+            self._seeder = None
+
+    @staticmethod
+    def _account(entry: Dict[str, Any]) -> SeededAccount:
+        return SeededAccount(**{key: value for key, value in entry.items() if key != "leased_by"})
+
+
+# Per-process handle on the run's pool; accounts are only created on first acquire
+account_pool = AccountPool()
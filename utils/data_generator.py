@@ -1,20 +1,82 @@
 """
 Data generation utilities for test automation.
+
+Faker is imported and its locales built on first use, with only the
+providers listed in FAKER_PROVIDERS, so importing this module (every
+conftest and xdist worker does) costs nothing until data is generated.
+
+Usage:
+    python -m utils.data_generator    # import and first-use cost
 """
+import sys
+import uuid
 import random
 import string
+import statistics
+import subprocess
+import threading
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
-from faker import Faker
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
+from config.settings import settings
+from utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+logger = get_logger(__name__)
+
+# Providers behind the methods below; Faker loads about 25 more by default
+FAKER_PROVIDERS = [
+    f"faker.providers.{name}" for name in (
+        "person", "address", "internet", "phone_number", "company",
+        "job", "date_time", "lorem", "misc"
+    )
+]
 
 
 class DataGenerator:
     """Data generator for test data creation."""
     
     def __init__(self, locale: str = 'pt_BR'):
-        """Initialize the data generator with locale."""
-        self.fake = Faker(locale)
-        self.fake_en = Faker('en_US')  # For English data when needed
+        """Initialize the data generator with locale; Faker instances are built on first use."""
+        self.locale = locale
+        self.random = random.Random()
+        self._fakers: Dict[str, "Faker"] = {}
+        self._seed: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    def faker(self, locale: str) -> "Faker":
+        """Faker for a locale, built once per generator with FAKER_PROVIDERS only."""
+        instance = self._fakers.get(locale)
+        if instance is None:
+            with self._lock:
+                instance = self._fakers.get(locale)
+                if instance is None:
+                    from faker import Faker
+                    instance = Faker(locale, providers=list(FAKER_PROVIDERS))
+                    if self._seed is not None:
+                        instance.seed_instance(self._seed)
+                    self._fakers[locale] = instance
+        return instance
+    
+    @property
+    def fake(self) -> "Faker":
+        """Faker for the generator's locale."""
+        return self.faker(self.locale)
+    
+    @property
+    def fake_en(self) -> "Faker":
+        """English Faker, for data DemoQA validates as ASCII (Book Store accounts)."""
+        return self.faker('en_US')
+    
+    def seed(self, value: int) -> None:
+        """Seed Faker and the random choices so the next records can be reproduced."""
+        with self._lock:
+            self._seed = value
+            for instance in self._fakers.values():
+                instance.seed_instance(value)
+        self.random.seed(value)
     
     def generate_user_data(self) -> Dict[str, Any]:
         """Generate complete user data for forms."""
@@ -29,8 +91,8 @@ class DataGenerator:
             "state": self.fake.state(),
             "postal_code": self.fake.postcode(),
             "country": self.fake.country(),
-            "age": random.randint(18, 65),
-            "salary": random.randint(3000, 15000),
+            "age": self.random.randint(18, 65),
+            "salary": self.random.randint(3000, 15000),
             "company": self.fake.company(),
             "job_title": self.fake.job(),
             "website": self.fake.url()
@@ -42,7 +104,7 @@ class DataGenerator:
             "first_name": self.fake.first_name(),
             "last_name": self.fake.last_name(),
             "email": self.fake.email(),
-            "gender": random.choice(["Male", "Female", "Other"]),
+            "gender": self.random.choice(["Male", "Female", "Other"]),
             "mobile": self.generate_mobile_number(),
             "date_of_birth": self.generate_date_of_birth(),
             "subjects": self.generate_subjects(),
@@ -55,7 +117,7 @@ class DataGenerator:
     def generate_mobile_number(self) -> str:
         """Generate a valid mobile number for forms."""
         # Generate 10-digit mobile number
-        return ''.join([str(random.randint(0, 9)) for _ in range(10)])
+        return ''.join([str(self.random.randint(0, 9)) for _ in range(10)])
     
     def generate_date_of_birth(self) -> str:
         """Generate a date of birth in DD MMM YYYY format."""
@@ -71,14 +133,14 @@ class DataGenerator:
             "English", "History", "Geography", "Economics", "Art",
             "Music", "Physical Education", "Literature", "Philosophy"
         ]
-        count = count or random.randint(1, 3)
-        return random.sample(subjects, min(count, len(subjects)))
+        count = count or self.random.randint(1, 3)
+        return self.random.sample(subjects, min(count, len(subjects)))
     
     def generate_hobbies(self, count: int = None) -> List[str]:
         """Generate random hobbies."""
         hobbies = ["Sports", "Reading", "Music"]
-        count = count or random.randint(1, 3)
-        return random.sample(hobbies, min(count, len(hobbies)))
+        count = count or self.random.randint(1, 3)
+        return self.random.sample(hobbies, min(count, len(hobbies)))
     
     def generate_web_table_data(self, count: int = 5) -> List[Dict[str, Any]]:
         """Generate data for web tables."""
@@ -88,9 +150,9 @@ class DataGenerator:
                 "first_name": self.fake.first_name(),
                 "last_name": self.fake.last_name(),
                 "email": self.fake.email(),
-                "age": random.randint(18, 65),
-                "salary": random.randint(3000, 15000),
-                "department": random.choice([
+                "age": self.random.randint(18, 65),
+                "salary": self.random.randint(3000, 15000),
+                "department": self.random.choice([
                     "Compliance", "Insurance", "Legal", "Engineering",
                     "Human Resources", "Marketing", "Sales", "Finance"
                 ])
@@ -102,18 +164,18 @@ class DataGenerator:
         return {
             "title": self.fake.sentence(nb_words=3),
             "body": self.fake.text(max_nb_chars=200),
-            "userId": random.randint(1, 100),
-            "id": random.randint(1, 1000),
-            "completed": random.choice([True, False])
+            "userId": self.random.randint(1, 100),
+            "id": self.random.randint(1, 1000),
+            "completed": self.random.choice([True, False])
         }
     
     def generate_file_data(self) -> Dict[str, Any]:
         """Generate file-related test data."""
         return {
-            "filename": f"test_file_{random.randint(1000, 9999)}.txt",
+            "filename": f"test_file_{self.random.randint(1000, 9999)}.txt",
             "content": self.fake.text(max_nb_chars=500),
-            "file_size": random.randint(1024, 10240),  # 1KB to 10KB
-            "file_type": random.choice(["txt", "pdf", "doc", "jpg", "png"])
+            "file_size": self.random.randint(1024, 10240),  # 1KB to 10KB
+            "file_type": self.random.choice(["txt", "pdf", "doc", "jpg", "png"])
         }
     
     def generate_performance_data(self, count: int = 100) -> List[Dict[str, Any]]:
@@ -123,9 +185,9 @@ class DataGenerator:
             data.append({
                 "id": i + 1,
                 "name": f"Performance Test Item {i + 1}",
-                "value": random.randint(1, 1000),
+                "value": self.random.randint(1, 1000),
                 "timestamp": datetime.now().isoformat(),
-                "category": random.choice(["A", "B", "C", "D", "E"])
+                "category": self.random.choice(["A", "B", "C", "D", "E"])
             })
         return data
     
@@ -134,7 +196,7 @@ class DataGenerator:
         characters = string.ascii_letters
         if include_digits:
             characters += string.digits
-        return ''.join(random.choice(characters) for _ in range(length))
+        return ''.join(self.random.choice(characters) for _ in range(length))
     
     def generate_email_variations(self, base_email: str) -> List[str]:
         """Generate email variations for testing."""
@@ -143,7 +205,7 @@ class DataGenerator:
             f"{name}+test@{domain}",
             f"{name}.test@{domain}",
             f"test.{name}@{domain}",
-            f"{name}_{random.randint(100, 999)}@{domain}"
+            f"{name}_{self.random.randint(100, 999)}@{domain}"
         ]
         return variations
     
@@ -188,17 +250,25 @@ class DataGenerator:
         return {
             "valid_username": "pandoraTeste",
             "valid_password": "Pandora@123",
-            "invalid_username": f"invalid_user_{random.randint(1000, 9999)}",
-            "invalid_password": f"wrong_pass_{random.randint(1000, 9999)}",
+            "invalid_username": f"invalid_user_{self.random.randint(1000, 9999)}",
+            "invalid_password": f"wrong_pass_{self.random.randint(1000, 9999)}",
             "empty_username": "",
             "empty_password": ""
         }
     
+    def generate_bookstore_account(self) -> Dict[str, str]:
+        """Generate a unique Account API user with a password meeting DemoQA's rules."""
+        return {
+            "userName": f"{self.fake_en.user_name()}_{uuid.uuid4().hex[:8]}",
+            # Upper, lower, digit and special character, 8+ characters
+            "password": f"{self.fake_en.password(length=10, special_chars=False)}Aa1!"
+        }
+    
     def generate_progress_bar_test_data(self) -> Dict[str, Any]:
         """Generate data for progress bar testing."""
         return {
             "start_value": 0,
-            "target_stop_value": random.randint(15, 25),
+            "target_stop_value": self.random.randint(15, 25),
             "end_value": 100,
             "reset_value": 0,
             "test_intervals": [10, 25, 50, 75, 90, 100]
@@ -265,5 +335,122 @@ class DataGenerator:
         }
 
 
-# Global data generator instance
+class RecordPool:
+    """
+    Ring buffers of pre-generated records, filled by a background thread.
+    
+    Every record is generated from its own seed, so take() returns the seed
+    with the record and replay() rebuilds the same record later. When a
+    buffer is empty the record is generated on the calling thread and
+    counted as a miss.
+    """
+    
+    KINDS = {"form": "generate_form_data", "user": "generate_user_data"}
+    
+    def __init__(self, capacity: int = None, locale: str = 'pt_BR', base_seed: int = None):
+        """Initialize empty buffers; the fill thread starts on the first take."""
+        self.capacity = settings.DATA_POOL_SIZE if capacity is None else capacity
+        self.locale = locale
+        self._seeds = random.Random(base_seed)
+        self._buffers: Dict[str, deque] = {kind: deque() for kind in self.KINDS}
+        self._condition = threading.Condition()
+        self._local = threading.local()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.stats = {kind: {"hits": 0, "misses": 0} for kind in self.KINDS}
+    
+    def _generator(self) -> DataGenerator:
+        """Per-thread generator, since seeding one is not thread-safe."""
+        generator = getattr(self._local, "generator", None)
+        if generator is None:
+            generator = self._local.generator = DataGenerator(self.locale)
+        return generator
+    
+    def _ensure_started(self) -> None:
+        """Start the fill thread on first use."""
+        with self._condition:
+            if self._closed or (self._thread and self._thread.is_alive()):
+                return
+            self._thread = threading.Thread(target=self._fill, name="record-pool", daemon=True)
+            self._thread.start()
+    
+    def _fill(self) -> None:
+        """Top up the emptiest buffer until every buffer is at capacity, then wait for takes."""
+        while True:
+            with self._condition:
+                while not self._closed and all(len(b) >= self.capacity for b in self._buffers.values()):
+                    self._condition.wait()
+                if self._closed:
+                    return
+                kind = min(self._buffers, key=lambda k: len(self._buffers[k]))
+                seed = self._seeds.getrandbits(32)
+            try:
+                record = self.replay(kind, seed)
+            except Exception as e:
+                logger.error(f"Record pool stopped filling: {e}")
+                return
+            with self._condition:
+                self._buffers[kind].append((seed, record))
+    
+    def take(self, kind: str) -> Tuple[int, Dict[str, Any]]:
+        """Pop a ready record and its seed, generating one on the spot if none is ready."""
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown record kind '{kind}', expected one of {sorted(self.KINDS)}")
+        if self.capacity > 0:
+            self._ensure_started()
+        with self._condition:
+            if self._buffers[kind]:
+                self.stats[kind]["hits"] += 1
+                self._condition.notify()
+                return self._buffers[kind].popleft()
+            self.stats[kind]["misses"] += 1
+            seed = self._seeds.getrandbits(32)
+        return seed, self.replay(kind, seed)
+    
+    def replay(self, kind: str, seed: int) -> Dict[str, Any]:
+        """Rebuild the record of the given kind for a seed, e.g. one logged by a failing test."""
+        generator = self._generator()
+        generator.seed(seed)
+        return getattr(generator, self.KINDS[kind])()
+    
+    def close(self) -> Dict[str, Dict[str, int]]:
+        """Stop the fill thread and return the hit/miss counters."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread:
+            self._thread.join()
+        self._thread = None
+        logger.info(f"Record pool: {self.stats}")
+        return self.stats
+
+
+def measure_import_cost(runs: int = 5) -> Dict[str, float]:
+    """Median milliseconds, in fresh interpreters, to import this module and to generate the first form record."""
+    probe = (
+        "import time; started = time.perf_counter(); "
+        "from utils.data_generator import data_generator; imported = time.perf_counter(); "
+        "data_generator.generate_form_data(); "
+        "print((imported - started) * 1000, (time.perf_counter() - imported) * 1000)"
+    )
+    # config and logging are imported by every test module anyway; only this module's share is timed
+    setup = "import config.settings, utils.logger; "
+    samples = [
+        [float(v) for v in subprocess.check_output([sys.executable, "-c", setup + probe], text=True).split()[-2:]]
+        for _ in range(runs)
+    ]
+    return {
+        "import_ms": round(statistics.median(s[0] for s in samples), 1),
+        "first_record_ms": round(statistics.median(s[1] for s in samples), 1)
+    }
+
+
+# Global data generator instance; Faker is only built when a method needs it
 data_generator = DataGenerator()
+
+# Pre-generated form and user records for the test_data and user_data fixtures
+record_pool = RecordPool()
+
+
+if __name__ == "__main__":
+    print(measure_import_cost())
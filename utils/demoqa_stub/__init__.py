@@ -0,0 +1,6 @@
+"""
+Local DemoQA stand-in for offline, low-latency test runs.
+"""
+from utils.demoqa_stub.server import DemoQAStubServer, AccountStore, BOOKS
+
+__all__ = ["DemoQAStubServer", "AccountStore", "BOOKS"]
@@ -0,0 +1,344 @@
+"""
+Threaded HTTP stand-in for the parts of DemoQA exercised by the suites.
+"""
+import os
+import json
+import uuid
+import secrets
+import threading
+from datetime import datetime, timedelta
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit, parse_qs
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PAGES_DIR = os.path.join(os.path.dirname(__file__), "pages")
+
+# Page routes -> (template, title, show side menu)
+PAGE_ROUTES = {
+    "/": ("home.html", "DEMOQA", False),
+    "/elements": ("section.html", "DEMOQA", True),
+    "/forms": ("section.html", "DEMOQA", True),
+    "/alertsWindows": ("section.html", "DEMOQA", True),
+    "/widgets": ("section.html", "DEMOQA", True),
+    "/automation-practice-form": ("practice_form.html", "DEMOQA", True),
+    "/webtables": ("web_tables.html", "DEMOQA", True),
+    "/progress-bar": ("progress_bar.html", "DEMOQA", True),
+    "/browser-windows": ("browser_windows.html", "DEMOQA", True),
+    "/books": ("books.html", "DEMOQA", True),
+    "/login": ("login.html", "DEMOQA", True),
+    "/profile": ("profile.html", "DEMOQA", True),
+    "/sample": ("sample.html", "", False),
+}
+
+MENU_ITEMS = [
+    ("Elements", [("Web Tables", "/webtables")]),
+    ("Forms", [("Practice Form", "/automation-practice-form")]),
+    ("Alerts, Frame & Windows", [("Browser Windows", "/browser-windows")]),
+    ("Widgets", [("Progress Bar", "/progress-bar")]),
+    ("Book Store Application", [("Login", "/login"), ("Book Store", "/books"), ("Profile", "/profile")]),
+]
+
+LAYOUT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+  body {{ font-family: sans-serif; margin: 0; }}
+  .card {{ display: inline-block; width: 200px; margin: 10px; padding: 20px; border: 1px solid #ccc; cursor: pointer; }}
+  .left-pannel {{ float: left; width: 220px; }}
+  .main {{ margin-left: 240px; padding: 10px; }}
+  .menu-list li {{ cursor: pointer; }}
+  .modal {{ position: fixed; top: 10%; left: 30%; background: #fff; border: 1px solid #999; padding: 20px; }}
+  .rt-tr {{ display: flex; }}
+  .rt-th, .rt-td {{ flex: 1; min-height: 20px; }}
+  .action-icon {{ display: inline-block; width: 16px; height: 16px; margin-right: 4px; background: #ddd; cursor: pointer; }}
+  .react-datepicker__day {{ display: inline-block; width: 24px; cursor: pointer; }}
+</style>
+</head>
+<body>
+<div id="app">
+{menu}
+<div class="main">
+{body}
+</div>
+</div>
+</body>
+</html>
+"""
+
+BOOKS = [
+    {"isbn": "9781449325862", "title": "Git Pocket Guide", "subTitle": "A Working Introduction",
+     "author": "Richard E. Silverman", "publisher": "O'Reilly Media", "pages": 234},
+    {"isbn": "9781449331818", "title": "Learning JavaScript Design Patterns",
+     "subTitle": "A JavaScript and jQuery Developer's Guide",
+     "author": "Addy Osmani", "publisher": "O'Reilly Media", "pages": 254},
+    {"isbn": "9781449337711", "title": "Designing Evolvable Web APIs with ASP.NET",
+     "subTitle": "Harnessing the Power of the Web",
+     "author": "Glenn Block et al.", "publisher": "O'Reilly Media", "pages": 238},
+    {"isbn": "9781449365035", "title": "Speaking JavaScript", "subTitle": "An In-Depth Guide for Programmers",
+     "author": "Axel Rauschmayer", "publisher": "O'Reilly Media", "pages": 460},
+    {"isbn": "9781491904244", "title": "You Don't Know JS", "subTitle": "ES6 & Beyond",
+     "author": "Kyle Simpson", "publisher": "O'Reilly Media", "pages": 278},
+    {"isbn": "9781491950296", "title": "Programming JavaScript Applications",
+     "subTitle": "Robust Web Architecture With Node, HTML5, and Modern JS Libraries",
+     "author": "Eric Elliott", "publisher": "O'Reilly Media", "pages": 254},
+    {"isbn": "9781593275846", "title": "Eloquent JavaScript, Second Edition",
+     "subTitle": "A Modern Introduction to Programming",
+     "author": "Marijn Haverbeke", "publisher": "No Starch Press", "pages": 472},
+    {"isbn": "9781593277574", "title": "Understanding ECMAScript 6",
+     "subTitle": "The Definitive Guide for JavaScript Developers",
+     "author": "Nicholas C. Zakas", "publisher": "No Starch Press", "pages": 352},
+]
+
+
+def _render_menu() -> str:
+    """Left side menu with the groups and items the BDD steps click."""
+    groups = []
+    for group, items in MENU_ITEMS:
+        entries = "".join(
+            f'<li onclick="window.location.href=\'{href}\'"><span class="text">{label}</span></li>'
+            for label, href in items
+        )
+        groups.append(f'<div class="element-group"><div class="header-text">{group}</div>'
+                      f'<ul class="menu-list">{entries}</ul></div>')
+    return f'<div class="left-pannel">{"".join(groups)}</div>'
+
+
+class AccountStore:
+    """In-memory Account and BookStore state, safe for concurrent requests."""
+
+    def __init__(self):
+        """Initialize empty state."""
+        self._lock = threading.Lock()
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.tokens: Dict[str, str] = {}
+
+    def create_user(self, username: str, password: str) -> Tuple[int, Dict[str, Any]]:
+        """Create a user, rejecting duplicates like DemoQA does."""
+        if not username or not password:
+            return HTTPStatus.BAD_REQUEST, {"code": "1200", "message": "UserName and Password required."}
+        with self._lock:
+            if any(user["username"] == username for user in self.users.values()):
+                return HTTPStatus.NOT_ACCEPTABLE, {"code": "1204", "message": "User exists!"}
+            user_id = str(uuid.uuid4())
+            self.users[user_id] = {"userId": user_id, "username": username, "password": password, "books": []}
+        return HTTPStatus.CREATED, {"userID": user_id, "username": username, "books": []}
+
+    def find(self, username: str, password: str) -> Optional[Dict[str, Any]]:
+        """Look up a user by credentials."""
+        with self._lock:
+            for user in self.users.values():
+                if user["username"] == username and user["password"] == password:
+                    return user
+        return None
+
+    def issue_token(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate a bearer token for a user."""
+        token = secrets.token_hex(32)
+        expires = (datetime.utcnow() + timedelta(days=7)).isoformat() + "Z"
+        with self._lock:
+            self.tokens[token] = user["userId"]
+        return {"token": token, "expires": expires, "status": "Success", "result": "User authorized successfully."}
+
+    def user_for_token(self, authorization: str) -> Optional[Dict[str, Any]]:
+        """Resolve the user from an Authorization header."""
+        token = (authorization or "").replace("Bearer ", "", 1).strip()
+        with self._lock:
+            user_id = self.tokens.get(token)
+            return self.users.get(user_id) if user_id else None
+
+    def delete_user(self, user_id: str) -> None:
+        """Delete a user and its tokens."""
+        with self._lock:
+            self.users.pop(user_id, None)
+            self.tokens = {token: owner for token, owner in self.tokens.items() if owner != user_id}
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Serves the stand-in pages and the Account/BookStore API."""
+
+    server_version = "DemoQAStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def store(self) -> AccountStore:
+        return self.server.store
+
+    def log_message(self, format: str, *args) -> None:
+        """Route access logs to the structured logger at DEBUG."""
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _route(self) -> Tuple[str, Dict[str, list]]:
+        """Path without the optional /api prefix, plus query parameters."""
+        parts = urlsplit(self.path)
+        path = parts.path
+        if path.startswith("/api/"):
+            path = path[len("/api"):]
+        if len(path) > 1:
+            path = path.rstrip("/")
+        return path, parse_qs(parts.query)
+
+    def _body(self) -> Dict[str, Any]:
+        """Parse the JSON request body."""
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length).decode("utf-8"))
+        except ValueError:
+            return {}
+
+    def _send(self, status: int, payload: Any = None, content_type: str = "application/json") -> None:
+        """Write a complete response."""
+        if payload is None:
+            data = b""
+        elif isinstance(payload, str):
+            data = payload.encode("utf-8")
+        else:
+            data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _unauthorized(self) -> None:
+        self._send(HTTPStatus.UNAUTHORIZED, {"code": "1200", "message": "User not authorized!"})
+
+    def do_GET(self) -> None:
+        path, query = self._route()
+        if path in PAGE_ROUTES:
+            self._send(HTTPStatus.OK, self.server.render_page(path), "text/html")
+        elif path == "/favicon.ico":
+            self._send(HTTPStatus.NO_CONTENT)
+        elif path == "/BookStore/v1/Books":
+            self._send(HTTPStatus.OK, {"books": BOOKS})
+        elif path == "/BookStore/v1/Book":
+            isbn = query.get("ISBN", [""])[0]
+            book = next((book for book in BOOKS if book["isbn"] == isbn), None)
+            if book:
+                self._send(HTTPStatus.OK, book)
+            else:
+                self._send(HTTPStatus.BAD_REQUEST, {"code": "1205", "message": "ISBN supplied is not available in Books Collection!"})
+        elif path.startswith("/Account/v1/User/"):
+            user = self.store.user_for_token(self.headers.get("Authorization"))
+            if not user or user["userId"] != path.rsplit("/", 1)[-1]:
+                return self._unauthorized()
+            self._send(HTTPStatus.OK, {"userId": user["userId"], "username": user["username"], "books": user["books"]})
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"code": "404", "message": f"Not found: {path}"})
+
+    def do_POST(self) -> None:
+        path, _ = self._route()
+        body = self._body()
+        if path == "/Account/v1/User":
+            status, payload = self.store.create_user(body.get("userName"), body.get("password"))
+            self._send(status, payload)
+        elif path in ("/Account/v1/GenerateToken", "/Account/v1/Login"):
+            user = self.store.find(body.get("userName"), body.get("password"))
+            if path == "/Account/v1/GenerateToken":
+                if not user:
+                    return self._send(HTTPStatus.OK, {"token": None, "expires": None, "status": "Failed",
+                                                      "result": "User authorization failed."})
+                return self._send(HTTPStatus.OK, self.store.issue_token(user))
+            if not user:
+                return self._send(HTTPStatus.NOT_FOUND, {"code": "1207", "message": "User not found!"})
+            token = self.store.issue_token(user)
+            self._send(HTTPStatus.OK, {"userId": user["userId"], "username": user["username"],
+                                       "password": user["password"], "token": token["token"],
+                                       "expires": token["expires"], "isActive": False})
+        elif path == "/Account/v1/Authorized":
+            user = self.store.find(body.get("userName"), body.get("password"))
+            if user:
+                self._send(HTTPStatus.OK, True)
+            else:
+                self._send(HTTPStatus.NOT_FOUND, {"code": "1207", "message": "User not found!"})
+        elif path == "/BookStore/v1/Books":
+            user = self.store.user_for_token(self.headers.get("Authorization"))
+            if not user or user["userId"] != body.get("userId"):
+                return self._unauthorized()
+            isbns = [item.get("isbn") for item in body.get("collectionOfIsbns", [])]
+            known = {book["isbn"]: book for book in BOOKS}
+            if any(isbn not in known for isbn in isbns):
+                return self._send(HTTPStatus.BAD_REQUEST, {"code": "1205", "message": "ISBN supplied is not available in Books Collection!"})
+            owned = {book["isbn"] for book in user["books"]}
+            if owned.intersection(isbns):
+                return self._send(HTTPStatus.BAD_REQUEST, {"code": "1210", "message": "ISBN already present in the User's Collection!"})
+            user["books"].extend(known[isbn] for isbn in isbns)
+            self._send(HTTPStatus.CREATED, {"books": [{"isbn": isbn} for isbn in isbns]})
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"code": "404", "message": f"Not found: {path}"})
+
+    def do_DELETE(self) -> None:
+        path, query = self._route()
+        body = self._body()
+        user = self.store.user_for_token(self.headers.get("Authorization"))
+        if path.startswith("/Account/v1/User/"):
+            if not user or user["userId"] != path.rsplit("/", 1)[-1]:
+                return self._unauthorized()
+            self.store.delete_user(user["userId"])
+            self._send(HTTPStatus.NO_CONTENT)
+        elif path == "/BookStore/v1/Books":
+            if not user or user["userId"] != query.get("UserId", [""])[0]:
+                return self._unauthorized()
+            user["books"] = []
+            self._send(HTTPStatus.NO_CONTENT)
+        elif path == "/BookStore/v1/Book":
+            if not user or user["userId"] != body.get("userId"):
+                return self._unauthorized()
+            remaining = [book for book in user["books"] if book["isbn"] != body.get("isbn")]
+            if len(remaining) == len(user["books"]):
+                return self._send(HTTPStatus.BAD_REQUEST, {"code": "1206", "message": "ISBN supplied is not available in User's Collection!"})
+            user["books"] = remaining
+            self._send(HTTPStatus.NO_CONTENT)
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"code": "404", "message": f"Not found: {path}"})
+
+
+class DemoQAStubServer(ThreadingHTTPServer):
+    """Local DemoQA stand-in bound to an ephemeral port."""
+
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """Bind the server; port 0 lets the OS pick a free port."""
+        super().__init__((host, port), StubRequestHandler)
+        self.store = AccountStore()
+        self._pages: Dict[str, str] = {}
+        self._menu = _render_menu()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def render_page(self, path: str) -> str:
+        """Render a page once and serve it from memory afterwards."""
+        if path not in self._pages:
+            template, title, with_menu = PAGE_ROUTES[path]
+            with open(os.path.join(PAGES_DIR, template), "r", encoding="utf-8") as f:
+                body = f.read()
+            self._pages[path] = LAYOUT.format(title=title, menu=self._menu if with_menu else "", body=body)
+        return self._pages[path]
+
+    def start(self) -> "DemoQAStubServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, name="demoqa-stub", daemon=True)
+        self._thread.start()
+        logger.info(f"DemoQA stand-in listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self.shutdown()
+        self.server_close()
+        if self._thread:
+            self._thread.join()
+        logger.info("DemoQA stand-in stopped")
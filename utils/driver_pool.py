@@ -0,0 +1,176 @@
+"""
+Warm WebDriver pool backing pytest fixtures and behave hooks.
+"""
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional
+from selenium.common.exceptions import WebDriverException
+from config.settings import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Control messages for the maintenance thread
+_REFILL = object()
+_STOP = object()
+
+
+def reset_driver_state(driver, home_window: str = None, implicit_wait: float = None) -> None:
+    """Bring a driver back to a blank state: one window, no cookies, no storage."""
+    handles = driver.window_handles
+    home_window = home_window if home_window in handles else handles[0]
+
+    # Close every window the test opened
+    for handle in handles:
+        if handle != home_window:
+            driver.switch_to.window(handle)
+            driver.close()
+    driver.switch_to.window(home_window)
+
+    # Storage is per origin, so clear it before leaving the current page
+    try:
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    except WebDriverException:
+        # about:blank and data: URLs have no storage
+        pass
+
+    # Chromium drivers can drop cookies for every domain in one call
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    else:
+        driver.delete_all_cookies()
+
+    driver.get("about:blank")
+    if implicit_wait is not None:
+        driver.implicitly_wait(implicit_wait)
+
+
+class DriverPool:
+    """Pool of pre-launched drivers, one pool per pytest-xdist worker."""
+
+    def __init__(self, factory: Callable[[], Any], size: int = None,
+                 acquire_timeout: float = 120.0, implicit_wait: float = None):
+        """Initialize the pool with a driver factory."""
+        self.factory = factory
+        self.size = max(1, size or settings.DRIVER_POOL_SIZE)
+        self.acquire_timeout = acquire_timeout
+        self.implicit_wait = implicit_wait
+        self.worker_id = settings.get_worker_id()
+        self.stats = {"launched": 0, "acquired": 0, "cold_waits": 0, "discarded": 0}
+
+        self._idle = queue.Queue()
+        self._tasks = queue.Queue()
+        self._lock = threading.Lock()
+        self._home_windows: Dict[int, str] = {}
+        self._drivers = []
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "DriverPool":
+        """Start the background thread and launch the initial drivers."""
+        self._thread = threading.Thread(
+            target=self._maintain,
+            name=f"driver-pool-{self.worker_id}",
+            daemon=True
+        )
+        self._thread.start()
+        self._tasks.put(_REFILL)
+        logger.info(f"Driver pool started for worker {self.worker_id} with size {self.size}")
+        return self
+
+    def acquire(self):
+        """Take a clean driver, waiting only if none is warm yet."""
+        if self._closed:
+            raise RuntimeError("Driver pool is closed")
+
+        try:
+            item = self._idle.get_nowait()
+        except queue.Empty:
+            self.stats["cold_waits"] += 1
+            logger.debug(f"No warm driver available on worker {self.worker_id}, waiting")
+            try:
+                item = self._idle.get(timeout=self.acquire_timeout)
+            except queue.Empty:
+                raise RuntimeError(
+                    f"No driver became available within {self.acquire_timeout} seconds"
+                )
+
+        if isinstance(item, Exception):
+            # Let the next acquire retry the launch
+            self._tasks.put(_REFILL)
+            raise item
+
+        self.stats["acquired"] += 1
+        return item
+
+    def release(self, driver) -> None:
+        """Return a driver; it is reset in the background before reuse."""
+        if self._closed:
+            self._quit(driver)
+            return
+        self._tasks.put(driver)
+
+    def shutdown(self) -> None:
+        """Stop the background thread and quit every driver."""
+        self._closed = True
+        self._tasks.put(_STOP)
+        if self._thread:
+            self._thread.join(timeout=self.acquire_timeout)
+
+        with self._lock:
+            drivers = list(self._drivers)
+        for driver in drivers:
+            self._quit(driver)
+        logger.info(f"Driver pool closed for worker {self.worker_id}: {self.stats}")
+
+    def _maintain(self) -> None:
+        """Reset released drivers and keep the pool filled."""
+        while True:
+            task = self._tasks.get()
+            if task is _STOP:
+                return
+            if task is not _REFILL:
+                self._recycle(task)
+            self._refill()
+
+    def _recycle(self, driver) -> None:
+        """Reset a released driver, discarding it if the reset fails."""
+        try:
+            reset_driver_state(driver, self._home_windows.get(id(driver)), self.implicit_wait)
+        except Exception as e:
+            logger.warning(f"Discarding driver that failed to reset: {e}")
+            self.stats["discarded"] += 1
+            self._quit(driver)
+            return
+        self._idle.put(driver)
+
+    def _refill(self) -> None:
+        """Launch drivers until the pool is back at its configured size."""
+        while not self._closed:
+            with self._lock:
+                if len(self._drivers) >= self.size:
+                    return
+            try:
+                driver = self.factory()
+            except Exception as e:
+                logger.error(f"Failed to launch pooled driver: {e}")
+                self._idle.put(e)
+                return
+
+            with self._lock:
+                self._drivers.append(driver)
+                self._home_windows[id(driver)] = driver.current_window_handle
+            self.stats["launched"] += 1
+            self._idle.put(driver)
+            logger.debug(f"Pooled driver launched on worker {self.worker_id}")
+
+    def _quit(self, driver) -> None:
+        """Quit a driver and forget about it."""
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            self._home_windows.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Failed to quit pooled driver: {e}")
@@ -0,0 +1,243 @@
+"""
+Chromedriver resolution with a persistent cache shared by pytest and behave.
+"""
+import os
+import sys
+import json
+import shutil
+import hashlib
+import functools
+from typing import Dict, Any, Optional
+from config.settings import settings
+from utils.file_lock import file_lock
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Common executable headers: ELF for Linux, MZ for Windows, Mach-O for Mac
+VALID_HEADERS = [b'\x7fELF', b'MZ', b'\xca\xfe\xba\xbe', b'\xce\xfa\xed\xfe']
+MAC_PATTERNS = ['chromedriver_mac64', 'chromedriver_mac_arm64', 'chromedriver-mac']
+NON_BINARY_MARKERS = ['license', 'notice', 'third_party', 'readme', '.txt']
+# Where Chrome lives, so its version can be reused while the binary is unchanged
+CHROME_COMMANDS = ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser']
+CHROME_PATHS = {
+    'darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+    'win32': [
+        os.path.expandvars(r'%ProgramFiles%\Google\Chrome\Application\chrome.exe'),
+        os.path.expandvars(r'%ProgramFiles(x86)%\Google\Chrome\Application\chrome.exe'),
+        os.path.expandvars(r'%LocalAppData%\Google\Chrome\Application\chrome.exe')
+    ]
+}
+UNKNOWN_VERSION = "unknown"
+BROWSER_ENTRY = "_browser"
+
+
+def _is_executable_binary(path: str) -> bool:
+    """Check that a path is a real driver executable, not a notice or license file."""
+    if not os.path.isfile(path):
+        return False
+
+    try:
+        if sys.platform != 'win32':
+            if not os.access(path, os.X_OK):
+                os.chmod(path, 0o755)
+            with open(path, 'rb') as f:
+                header = f.read(4)
+            return any(header.startswith(h) for h in VALID_HEADERS)
+        # On Windows just check the extension
+        return path.lower().endswith('.exe')
+    except Exception as e:
+        logger.error(f"Binary verification error for {path}: {e}")
+        return False
+
+
+def _locate_binary(install_path: str) -> str:
+    """Find the chromedriver binary next to the path reported by the manager."""
+    parent_dir = os.path.dirname(install_path)
+
+    # 1. Standard name
+    exact_match = os.path.join(parent_dir, 'chromedriver')
+    if _is_executable_binary(exact_match):
+        return exact_match
+
+    candidates = sorted(os.listdir(parent_dir))
+
+    # 2. macOS variants
+    if sys.platform == 'darwin':
+        for pattern in MAC_PATTERNS:
+            for file in candidates:
+                path = os.path.join(parent_dir, file)
+                if pattern in file.lower() and _is_executable_binary(path):
+                    return path
+
+    # 3. Anything named chromedriver that is not a notice file
+    for file in candidates:
+        file_lower = file.lower()
+        if any(marker in file_lower for marker in NON_BINARY_MARKERS):
+            continue
+        path = os.path.join(parent_dir, file)
+        if 'chromedriver' in file_lower and _is_executable_binary(path):
+            return path
+
+    # 4. Trust the manager
+    logger.info("No suitable chromedriver binary found, using ChromeDriverManager path")
+    return install_path
+
+
+def _checksum(path: str) -> str:
+    """SHA-256 of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _find_chrome_binary() -> Optional[str]:
+    """Real path of the installed Chrome executable, if it can be found."""
+    candidates = [shutil.which(command) for command in CHROME_COMMANDS]
+    candidates += CHROME_PATHS.get(sys.platform, [])
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return os.path.realpath(candidate)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def get_browser_version() -> str:
+    """Installed Chrome version, detected once per process."""
+    try:
+        from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+        version = OperationSystemManager().get_browser_version_from_os(ChromeType.GOOGLE)
+    except Exception as e:
+        logger.warning(f"Could not detect Chrome version: {e}")
+        version = None
+    return version or UNKNOWN_VERSION
+
+
+class DriverCache:
+    """On-disk cache of resolved driver binaries keyed by browser version."""
+
+    def __init__(self, cache_file: str = None):
+        """Initialize the cache with its file location."""
+        self.cache_file = cache_file or settings.DRIVER_CACHE_FILE
+        self.lock_file = f"{self.cache_file}.lock"
+        self._entries: Optional[Dict[str, Any]] = None
+
+    def load(self) -> Dict[str, Any]:
+        """Read every cached entry."""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def lookup(self, version: str) -> Optional[str]:
+        """Return the cached binary path, verified with a single stat."""
+        if self._entries is None:
+            self._entries = self.load()
+        entry = self._entries.get(version)
+        if not entry:
+            return None
+
+        try:
+            stat = os.stat(entry["path"])
+        except OSError:
+            logger.info(f"Cached chromedriver is missing: {entry['path']}")
+            return None
+
+        if stat.st_size == entry["size"] and int(stat.st_mtime) == entry["mtime"]:
+            return entry["path"]
+
+        # The file changed on disk; only trust it if the content is the same
+        if _checksum(entry["path"]) == entry["checksum"]:
+            return entry["path"]
+        logger.warning(f"Cached chromedriver checksum mismatch: {entry['path']}")
+        return None
+
+    def store(self, version: str, path: str) -> None:
+        """Record a resolved binary. Caller must hold the lock."""
+        stat = os.stat(path)
+        entries = self.load()
+        entries[version] = {
+            "path": path,
+            "checksum": _checksum(path),
+            "size": stat.st_size,
+            "mtime": int(stat.st_mtime)
+        }
+        self._write(entries)
+
+    def _write(self, entries: Dict[str, Any]) -> None:
+        """Replace the cache file atomically so readers never see a partial file."""
+        self._entries = entries
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f, indent=2)
+        os.replace(tmp_file, self.cache_file)
+
+    def browser_version(self) -> str:
+        """
+        Installed Chrome version, reused from the cache while the Chrome binary
+        keeps its size and mtime; otherwise detected (a subprocess) and cached.
+        """
+        binary = _find_chrome_binary()
+        if binary is None:
+            return get_browser_version()
+        stat = os.stat(binary)
+        if self._entries is None:
+            self._entries = self.load()
+        entry = self._entries.get(BROWSER_ENTRY)
+        unchanged = entry and (entry["path"], entry["size"], entry["mtime"]) == (
+            binary, stat.st_size, int(stat.st_mtime)
+        )
+        if unchanged:
+            return entry["version"]
+
+        version = get_browser_version()
+        if version != UNKNOWN_VERSION:
+            with file_lock(self.lock_file):
+                entries = self.load()
+                entries[BROWSER_ENTRY] = {
+                    "path": binary, "size": stat.st_size, "mtime": int(stat.st_mtime), "version": version
+                }
+                self._write(entries)
+        return version
+
+    def resolve(self) -> str:
+        """Return the chromedriver path, running the manager only on a cache miss."""
+        version = self.browser_version()
+        # Without a version a cached driver could belong to an older Chrome
+        cacheable = version != UNKNOWN_VERSION
+        path = self.lookup(version) if cacheable else None
+        if path:
+            return path
+
+        with file_lock(self.lock_file):
+            # Another worker may have resolved it while we waited
+            self._entries = self.load()
+            path = self.lookup(version) if cacheable else None
+            if path:
+                return path
+
+            from webdriver_manager.chrome import ChromeDriverManager
+            install_path = ChromeDriverManager().install()
+            logger.info(f"ChromeDriverManager reported install path: {install_path}")
+            path = _locate_binary(install_path)
+            if sys.platform != 'win32':
+                os.chmod(path, 0o755)
+            if not cacheable:
+                logger.warning(f"Chrome version unknown, chromedriver not cached: {path}")
+                return path
+            self.store(version, path)
+            logger.info(f"Cached chromedriver for Chrome {version}: {path}")
+            return path
+
+
+# Process-wide cache instance
+driver_cache = DriverCache()
+
+
+def resolve_chromedriver() -> str:
+    """Resolve the chromedriver binary through the shared cache."""
+    return driver_cache.resolve()
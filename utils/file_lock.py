@@ -0,0 +1,30 @@
+"""
+Inter-process file lock shared by the caches and tables written from several
+pytest-xdist workers or behave shards at once.
+"""
+import os
+import sys
+from contextlib import contextmanager
+
+
+@contextmanager
+def file_lock(lock_path: str):
+    """Exclusive inter-process lock, safe across pytest-xdist workers."""
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, 'a+') as lock_file:
+        if sys.platform == 'win32':
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
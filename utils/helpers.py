@@ -2,18 +2,29 @@
 Helper utilities for test automation.
 """
 import os
+import re
+import math
 import time
+import random
 import json
 import hashlib
+import functools
+import threading
 import requests
-from typing import Dict, List, Any, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from datetime import datetime, timedelta
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from config.settings import settings
 from utils.logger import get_logger
+from utils.waits import WaitEngine
+from utils.readiness import ReadinessDetector
 
 logger = get_logger(__name__)
 
@@ -25,10 +36,14 @@ class WebDriverHelper:
         """Initialize with WebDriver instance."""
         self.driver = driver
         self.wait = WebDriverWait(driver, settings.TIMEOUT)
+        self.waits = WaitEngine(driver)
     
     def wait_for_page_load(self, timeout: int = None) -> bool:
         """Wait for page to load completely."""
         timeout = timeout or settings.TIMEOUT
+        if settings.get_page_load_strategy() != "normal":
+            # eager/none skip the load event, so wait for the app itself
+            return self.wait_for_app_ready(timeout=timeout)
         try:
             self.wait.until(
                 lambda driver: driver.execute_script("return document.readyState") == "complete"
@@ -38,20 +53,29 @@ class WebDriverHelper:
             logger.warning("Page load timeout exceeded")
             return False
     
+    def wait_for_app_ready(self, url: str = None, timeout: int = None) -> bool:
+        """Wait until the route's root and key locators exist, without waiting for load."""
+        try:
+            ReadinessDetector(self.driver, timeout).wait_until_ready(url)
+            return True
+        except TimeoutException:
+            logger.warning("App readiness timeout exceeded")
+            return False
+    
     def scroll_to_bottom(self) -> None:
         """Scroll to bottom of page."""
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1)
+        self.waits.wait_for_scroll_end()
     
     def scroll_to_top(self) -> None:
         """Scroll to top of page."""
         self.driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        self.waits.wait_for_scroll_end()
     
     def scroll_to_element(self, element) -> None:
         """Scroll to specific element."""
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)
+        self.waits.wait_for_scroll_end()
     
     def get_page_height(self) -> int:
         """Get total page height."""
@@ -72,6 +96,169 @@ class WebDriverHelper:
         )
 
 
+class FormFiller:
+    """Helper class for filling React forms in a single round-trip."""
+    
+    # Data keys from DataGenerator mapped to element ids
+    WEB_TABLE_FIELDS = {
+        "firstName": "firstName",
+        "lastName": "lastName",
+        "email": "userEmail",
+        "age": "age",
+        "salary": "salary",
+        "department": "department"
+    }
+    PRACTICE_FORM_FIELDS = {
+        "first_name": "firstName",
+        "last_name": "lastName",
+        "email": "userEmail",
+        "mobile": "userNumber",
+        "current_address": "currentAddress"
+    }
+    
+    # Uses the native value setter so React's value tracker sees the change
+    _FILL_SCRIPT = """
+        var fields = arguments[0], missing = [];
+        for (var id in fields) {
+            var element = document.getElementById(id);
+            if (!element) { missing.push(id); continue; }
+            var prototype = element.tagName === 'TEXTAREA'
+                ? window.HTMLTextAreaElement.prototype
+                : window.HTMLInputElement.prototype;
+            Object.getOwnPropertyDescriptor(prototype, 'value').set.call(element, fields[id]);
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        return missing;
+    """
+    
+    def __init__(self, driver, field_ids: Dict[str, str] = None, keystroke_fields: List[str] = None):
+        """
+        Initialize with WebDriver instance.
+        
+        field_ids maps data keys to element ids; when given, only those keys are
+        filled. keystroke_fields lists data keys that need real keystrokes, such
+        as inputs with maxlength or key handlers, and are filled with send_keys.
+        """
+        self.driver = driver
+        self.field_ids = field_ids
+        self.keystroke_fields = set(keystroke_fields or [])
+    
+    def fill(self, data: Dict[str, Any]) -> List[str]:
+        """Fill every mapped scalar field and return the element ids filled."""
+        scripted = {}
+        typed = {}
+        for key, value in data.items():
+            if self.field_ids is not None and key not in self.field_ids:
+                continue
+            if not isinstance(value, (str, int, float)):
+                continue
+            element_id = self.field_ids[key] if self.field_ids is not None else key
+            if key in self.keystroke_fields:
+                typed[element_id] = str(value)
+            else:
+                scripted[element_id] = str(value)
+        
+        if scripted:
+            missing = self.driver.execute_script(self._FILL_SCRIPT, scripted)
+            if missing:
+                raise NoSuchElementException(f"Form fields not found: {missing}")
+        
+        for element_id, value in typed.items():
+            element = self.driver.find_element(By.ID, element_id)
+            element.clear()
+            element.send_keys(value)
+        
+        logger.debug(f"Filled {len(scripted)} fields by script and {len(typed)} by keystrokes")
+        return list(scripted) + list(typed)
+
+
+class TableSnapshot:
+    """Structured snapshot of a react-table, extracted in a single round-trip."""
+    
+    # Headers and non-padding rows of a .rt-table as plain strings
+    _EXTRACT_SCRIPT = """
+        var table = document.querySelector(arguments[0]);
+        if (!table) { return null; }
+        var headers = Array.prototype.map.call(
+            table.querySelectorAll('.rt-thead .rt-th'),
+            function (th) { return th.textContent.trim(); }
+        );
+        var rows = [];
+        table.querySelectorAll('.rt-tbody .rt-tr-group').forEach(function (group) {
+            var cells = Array.prototype.map.call(
+                group.querySelectorAll('.rt-td'),
+                function (td) { return td.textContent.replace(/\u00a0/g, ' ').trim(); }
+            );
+            if (cells.some(function (cell) { return cell !== ''; })) { rows.push(cells); }
+        });
+        return {headers: headers, rows: rows};
+    """
+    
+    DEFAULT_INDEXES = ("Email", "First Name")
+    
+    def __init__(self, headers: List[str], rows: List[List[str]], indexes: Tuple[str, ...] = DEFAULT_INDEXES):
+        """Initialize from raw headers and cell values."""
+        self.headers = headers
+        self.rows: List[Dict[str, str]] = [dict(zip(headers, cells)) for cells in rows]
+        self._indexes: Dict[str, Dict[str, List[Dict[str, str]]]] = {}
+        for column in indexes:
+            if column in headers:
+                self.index(column)
+    
+    @classmethod
+    def capture(cls, driver, selector: str = ".rt-table", indexes: Tuple[str, ...] = DEFAULT_INDEXES) -> "TableSnapshot":
+        """Capture the table currently rendered in the page."""
+        data = driver.execute_script(cls._EXTRACT_SCRIPT, selector)
+        if data is None:
+            raise NoSuchElementException(f"Table not found: {selector}")
+        return cls(data["headers"], data["rows"], indexes)
+    
+    def index(self, column: str) -> Dict[str, List[Dict[str, str]]]:
+        """Build (once) and return the value -> rows index for a column."""
+        if column not in self._indexes:
+            index: Dict[str, List[Dict[str, str]]] = {}
+            for row in self.rows:
+                index.setdefault(row.get(column, ""), []).append(row)
+            self._indexes[column] = index
+        return self._indexes[column]
+    
+    def find(self, column: str, value: str) -> List[Dict[str, str]]:
+        """Rows whose column equals value."""
+        return self.index(column).get(value, [])
+    
+    def contains(self, column: str, value: str) -> bool:
+        """Check whether any row has the value in the column."""
+        return bool(self.find(column, value))
+    
+    def diff(self, before: "TableSnapshot") -> Dict[str, Any]:
+        """
+        Compare with an earlier snapshot.
+        
+        Returns the added and removed rows and the kind of change: "create",
+        "delete" or "edit" for a single-row change, "none" or "multiple" otherwise.
+        """
+        remaining = Counter(tuple(row.items()) for row in before.rows)
+        added = []
+        for row in self.rows:
+            key = tuple(row.items())
+            if remaining[key] > 0:
+                remaining[key] -= 1
+            else:
+                added.append(row)
+        removed = [dict(key) for key, count in remaining.items() for _ in range(count)]
+        
+        kinds = {(1, 0): "create", (0, 1): "delete", (1, 1): "edit", (0, 0): "none"}
+        return {
+            "kind": kinds.get((len(added), len(removed)), "multiple"),
+            "added": added,
+            "removed": removed
+        }
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
 class FileHelper:
     """Helper class for file operations."""
     
@@ -151,6 +338,130 @@ class ValidationHelper:
         return bool(re.match(pattern, url))
 
 
+def _log_bounds(min_ns: int, max_ns: float, growth: float) -> List[int]:
+    """Bucket upper bounds from min_ns up to max_ns, each growth times the previous."""
+    bounds = []
+    bound = float(min_ns)
+    while bound < max_ns:
+        bounds.append(int(bound))
+        bound *= growth
+    return bounds
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; recording a sample does not allocate."""
+    
+    # Log-spaced bucket upper bounds from 1 microsecond to ~10 minutes, ~5% apart
+    GROWTH = 1.05
+    MIN_NS = 1_000
+    BOUNDS: List[int] = _log_bounds(MIN_NS, 600e9, GROWTH)
+    
+    def __init__(self):
+        """Initialize empty buckets."""
+        self.counts = array('Q', bytes(8 * (len(self.BOUNDS) + 1)))
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+    
+    def record(self, duration_ns: int) -> None:
+        """Add one sample."""
+        self.counts[bisect_left(self.BOUNDS, duration_ns)] += 1
+        if not self.count or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+    
+    def percentile(self, pct: float) -> int:
+        """Upper bound (ns) of the bucket holding the given percentile, capped at the max."""
+        if not self.count:
+            return 0
+        rank = max(1, int(math.ceil(self.count * pct / 100)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                upper = self.BOUNDS[index] if index < len(self.BOUNDS) else self.max_ns
+                return min(max(upper, self.min_ns), self.max_ns)
+        return self.max_ns
+    
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's samples to this one."""
+        for index, bucket_count in enumerate(other.counts):
+            if bucket_count:
+                self.counts[index] += bucket_count
+        if other.count:
+            self.min_ns = other.min_ns if not self.count else min(self.min_ns, other.min_ns)
+            self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+        return self
+    
+    def summary(self) -> Dict[str, Any]:
+        """Count and latency percentiles in milliseconds."""
+        def to_ms(ns: float) -> float:
+            return round(ns / 1e6, 3)
+        
+        return {
+            "count": self.count,
+            "mean_ms": to_ms(self.total_ns / self.count) if self.count else 0.0,
+            "min_ms": to_ms(self.min_ns),
+            "p50_ms": to_ms(self.percentile(50)),
+            "p90_ms": to_ms(self.percentile(90)),
+            "p99_ms": to_ms(self.percentile(99)),
+            "max_ms": to_ms(self.max_ns)
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form with sparse buckets, for shipping between processes."""
+        return {
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c},
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "min_ns": self.min_ns,
+            "max_ns": self.max_ns
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram from to_dict output."""
+        histogram = cls()
+        for index, bucket_count in data["buckets"].items():
+            histogram.counts[int(index)] = bucket_count
+        histogram.count = data["count"]
+        histogram.total_ns = data["total_ns"]
+        histogram.min_ns = data["min_ns"]
+        histogram.max_ns = data["max_ns"]
+        return histogram
+
+
+class _Span:
+    """Context manager timing one (possibly nested) span."""
+    
+    __slots__ = ("helper", "name", "path", "start_ns")
+    
+    def __init__(self, helper: "PerformanceHelper", name: str):
+        self.helper = helper
+        self.name = name
+        self.path = None
+        self.start_ns = 0
+    
+    def __enter__(self) -> "_Span":
+        stack = self.helper._stack()
+        self.path = f"{stack[-1]}/{self.name}" if stack else self.name
+        stack.append(self.path)
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration_ns = time.perf_counter_ns() - self.start_ns
+        self.helper._stack().pop()
+        self.helper.record(self.path, duration_ns)
+        return False
+
+
 class PerformanceHelper:
     """Helper class for performance testing."""
     
@@ -158,10 +469,44 @@ class PerformanceHelper:
         """Initialize performance helper."""
         self.start_times = {}
         self.metrics = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def _stack(self) -> List[str]:
+        """Open span paths for the current thread."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+    
+    def record(self, operation: str, duration_ns: int) -> None:
+        """Record one duration for an operation; safe to call from several threads."""
+        with self._lock:
+            histogram = self.histograms.get(operation)
+            if histogram is None:
+                histogram = self.histograms[operation] = LatencyHistogram()
+            histogram.record(duration_ns)
+    
+    def span(self, name: str) -> _Span:
+        """Time a block; spans opened inside it are recorded as 'outer/inner'."""
+        return _Span(self, name)
+    
+    def timed(self, name: str = None) -> Callable:
+        """Decorator recording every call of a function as a span."""
+        def decorator(func: Callable) -> Callable:
+            span_name = name or func.__qualname__
+            
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
     
     def start_timer(self, operation: str) -> None:
         """Start timing an operation."""
-        self.start_times[operation] = time.time()
+        self.start_times[operation] = time.perf_counter_ns()
         logger.debug(f"Started timing: {operation}")
     
     def end_timer(self, operation: str) -> float:
@@ -170,53 +515,142 @@ class PerformanceHelper:
             logger.warning(f"No start time found for operation: {operation}")
             return 0.0
         
-        duration = time.time() - self.start_times[operation]
+        duration_ns = time.perf_counter_ns() - self.start_times.pop(operation)
+        self.record(operation, duration_ns)
+        duration = duration_ns / 1e9
         self.metrics[operation] = duration
         logger.info(f"Operation '{operation}' took {duration:.2f} seconds")
         return duration
     
     def get_metrics(self) -> Dict[str, float]:
-        """Get all performance metrics."""
+        """Get the last duration of each timer-based operation."""
         return self.metrics.copy()
     
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Count, mean, p50/p90/p99 and max per operation."""
+        with self._lock:
+            return {operation: histogram.summary() for operation, histogram in sorted(self.histograms.items())}
+    
+    def export_json(self, path: str, **extra) -> str:
+        """Write the summary and mergeable histograms to a JSON file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        data = {
+            **extra,
+            "summary": self.summary()
+        }
+        with self._lock:
+            data["histograms"] = {operation: h.to_dict() for operation, h in self.histograms.items()}
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
+    
     def reset_metrics(self) -> None:
         """Reset all metrics."""
         self.start_times.clear()
         self.metrics.clear()
+        self.histograms.clear()
 
 
 class APIHelper:
     """Helper class for API testing."""
     
-    def __init__(self, base_url: str = None):
-        """Initialize API helper."""
-        self.base_url = base_url or settings.API_BASE_URL
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    _ID_SEGMENT = re.compile(r"/(?:[0-9a-fA-F-]{32,36}|\d+)(?=/|$)")
+    
+    def __init__(self, base_url: str = None, pool_size: int = None, retries: int = None):
+        """Initialize API helper with a keep-alive connection pool."""
+        # An empty base_url lets callers pass absolute URLs as the endpoint
+        self.base_url = settings.API_BASE_URL if base_url is None else base_url
+        self.timeout = (settings.API_CONNECT_TIMEOUT, settings.API_TIMEOUT)
+        self.retries = settings.API_RETRIES if retries is None else retries
+        self.performance = PerformanceHelper()
+        
+        # One pool per host, sized so concurrent workers never wait for or discard connections
+        pool_size = pool_size or settings.API_POOL_SIZE or max(settings.PARALLEL_WORKERS, 10)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
         self.session = requests.Session()
-        self.session.timeout = settings.API_TIMEOUT
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def _backoff(self, attempt: int, response: requests.Response = None) -> Optional[float]:
+        """
+        Exponential backoff with jitter, capped at API_MAX_RETRY_DELAY.
+        
+        A numeric Retry-After is honored up to that cap; above it None is
+        returned and the caller stops retrying rather than block the test.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= settings.API_MAX_RETRY_DELAY else None
+        return min(settings.API_BACKOFF_FACTOR * (2 ** attempt) * random.uniform(0.5, 1.5),
+                   settings.API_MAX_RETRY_DELAY)
+    
+    def request(self, method: str, endpoint: str, idempotent: bool = None, **kwargs) -> requests.Response:
+        """
+        Send a request with connect/read timeouts and retries.
+        
+        Only idempotent requests are retried (GET/HEAD/OPTIONS/PUT/DELETE, or
+        idempotent=True for e.g. a POST carrying an idempotency key), on
+        connection errors, timeouts and 429/502/503/504 responses.
+        """
+        method = method.upper()
+        url = f"{self.base_url}{endpoint}"
+        retryable = method in self.IDEMPOTENT_METHODS if idempotent is None else idempotent
+        attempts = 1 + (self.retries if retryable else 0)
+        kwargs.setdefault("timeout", self.timeout)
+        operation = f"{method} {self._ID_SEGMENT.sub('/{id}', endpoint)}"
+        
+        for attempt in range(attempts):
+            start = time.perf_counter_ns()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt + 1 >= attempts:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {url} failed ({type(e).__name__}), retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+            finally:
+                self.performance.record(operation, time.perf_counter_ns() - start)
+            
+            if response.status_code in self.RETRY_STATUSES and attempt + 1 < attempts:
+                delay = self._backoff(attempt, response)
+                if delay is None:
+                    logger.warning(f"{method} {url} returned {response.status_code} with Retry-After "
+                                   f"{response.headers.get('Retry-After')}s, above the retry limit")
+                    return response
+                logger.warning(f"{method} {url} returned {response.status_code}, retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+            logger.debug(f"{method} {url} -> {response.status_code} in {response.elapsed.total_seconds():.3f}s")
+            return response
     
     def get(self, endpoint: str, **kwargs) -> requests.Response:
         """Make GET request."""
-        url = f"{self.base_url}{endpoint}"
-        logger.info(f"GET request to: {url}")
-        return self.session.get(url, **kwargs)
+        return self.request("GET", endpoint, **kwargs)
     
     def post(self, endpoint: str, data: Dict[str, Any] = None, **kwargs) -> requests.Response:
         """Make POST request."""
-        url = f"{self.base_url}{endpoint}"
-        logger.info(f"POST request to: {url}")
-        return self.session.post(url, json=data, **kwargs)
+        return self.request("POST", endpoint, json=data, **kwargs)
     
     def put(self, endpoint: str, data: Dict[str, Any] = None, **kwargs) -> requests.Response:
         """Make PUT request."""
-        url = f"{self.base_url}{endpoint}"
-        logger.info(f"PUT request to: {url}")
-        return self.session.put(url, json=data, **kwargs)
+        return self.request("PUT", endpoint, json=data, **kwargs)
     
     def delete(self, endpoint: str, **kwargs) -> requests.Response:
         """Make DELETE request."""
-        url = f"{self.base_url}{endpoint}"
-        logger.info(f"DELETE request to: {url}")
-        return self.session.delete(url, **kwargs)
+        return self.request("DELETE", endpoint, **kwargs)
+    
+    def latency_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-endpoint latency percentiles of every attempt made."""
+        return self.performance.summary()
+    
+    def close(self) -> None:
+        """Close pooled connections."""
+        self.session.close()
     
     def validate_response(self, response: requests.Response, expected_status: int = 200) -> bool:
         """Validate API response."""
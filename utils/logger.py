@@ -1,14 +1,192 @@
 """
 Structured logging utility for the QA automation project.
 """
-import logging
-import json
+import os
 import sys
+import copy
+import json
+import time
+import queue
+import random
+import atexit
+import logging
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any, Optional
 from config.settings import settings
 
 
+class StructuredMessage:
+    """Log message serialized to JSON only when a handler formats it."""
+    
+    __slots__ = ("level", "message", "fields", "created")
+    
+    def __init__(self, level: str, message: str, fields: Dict[str, Any]):
+        """Capture the event; no formatting happens here."""
+        self.level = level
+        self.message = message
+        # Containers are copied so later changes by the caller do not leak into the log line
+        self.fields = {key: copy.copy(value) if isinstance(value, (dict, list, set)) else value
+                       for key, value in fields.items()}
+        self.created = datetime.now()
+    
+    def __str__(self) -> str:
+        log_data = {
+            "timestamp": self.created.isoformat(),
+            "level": self.level,
+            "message": self.message,
+            **self.fields
+        }
+        return json.dumps(log_data, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full."""
+    
+    def __init__(self, log_queue: queue.Queue):
+        """Initialize with a bounded queue."""
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through unformatted; the listener thread formats it."""
+        if record.exc_info:
+            # Tracebacks reference live frames, so render them on the calling thread
+            return super().prepare(record)
+        return record
+
+
+_backend_lock = threading.Lock()
+_queue_handler: Optional[DroppingQueueHandler] = None
+_listener: Optional[QueueListener] = None
+
+
+def get_queue_handler() -> DroppingQueueHandler:
+    """Process-wide queue handler feeding the shared console and file sinks."""
+    global _queue_handler, _listener
+    with _backend_lock:
+        if _queue_handler is None:
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setLevel(logging.INFO)
+            
+            # File handler, opened once per process
+            os.makedirs('reports', exist_ok=True)
+            file_handler = logging.FileHandler('reports/automation.log')
+            file_handler.setLevel(logging.DEBUG)
+            
+            # Formatter
+            formatter = logging.Formatter(settings.LOG_FORMAT)
+            console_handler.setFormatter(formatter)
+            file_handler.setFormatter(formatter)
+            
+            _queue_handler = DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+            _listener = QueueListener(_queue_handler.queue, console_handler, file_handler,
+                                      respect_handler_level=True)
+            _listener.start()
+            atexit.register(shutdown_logging)
+        return _queue_handler
+
+
+def get_logging_stats() -> Dict[str, int]:
+    """Records enqueued and dropped by the shared queue handler."""
+    if _queue_handler is None:
+        return {"enqueued": 0, "dropped": 0}
+    return {"enqueued": _queue_handler.enqueued, "dropped": _queue_handler.dropped}
+
+
+def shutdown_logging() -> None:
+    """Drain the queue and stop the listener thread."""
+    global _queue_handler, _listener
+    with _backend_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        stats = get_logging_stats()
+        if stats["dropped"]:
+            record = logging.LogRecord(__name__, logging.WARNING, __file__, 0,
+                                       f"Log queue full: dropped {stats['dropped']} of "
+                                       f"{stats['dropped'] + stats['enqueued']} records", None, None)
+            for handler in _listener.handlers:
+                handler.handle(record)
+        for handler in _listener.handlers:
+            handler.close()
+        _queue_handler, _listener = None, None
+
+
+class InteractionSampler:
+    """Decides which hot-path interaction events are logged, and aggregates the rest."""
+    
+    def __init__(self, mode: str = None, rates: Dict[str, float] = None, rate_limit: int = None):
+        """Initialize from Settings unless overridden."""
+        self.mode = (mode or settings.INTERACTION_LOG_MODE).lower()
+        if self.mode not in ("all", "sample", "aggregate"):
+            raise ValueError(f"Unsupported interaction log mode: {self.mode}")
+        self.rates = settings.get_interaction_sample_rates() if rates is None else rates
+        self.rate_limit = settings.INTERACTION_LOG_RATE_LIMIT if rate_limit is None else rate_limit
+        self._lock = threading.Lock()
+        self._windows: Dict[str, list] = {}
+        self._summary: Dict[str, Dict[str, Any]] = {}
+    
+    def should_log(self, event: str) -> bool:
+        """Sample and rate-limit one event; aggregate mode never logs single events."""
+        if self.mode == "aggregate":
+            return False
+        if self.mode == "sample" and random.random() >= self.rates.get(event, 1.0):
+            return False
+        if not self.rate_limit:
+            return True
+        # One-second window per event type
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(event, [now, 0])
+            if now - window[0] >= 1.0:
+                window[0], window[1] = now, 0
+            if window[1] >= self.rate_limit:
+                return False
+            window[1] += 1
+        return True
+    
+    def record(self, event: str, key: str, duration: float = None, failed: bool = False) -> None:
+        """Count an event (and its duration) toward the current test's summary."""
+        with self._lock:
+            entry = self._summary.setdefault(f"{event}:{key}", {
+                "count": 0, "failed": 0, "timed": 0, "total_ms": 0.0, "max_ms": 0.0
+            })
+            entry["count"] += 1
+            if failed:
+                entry["failed"] += 1
+            if duration is not None:
+                duration_ms = duration * 1000
+                entry["timed"] += 1
+                entry["total_ms"] += duration_ms
+                entry["max_ms"] = max(entry["max_ms"], duration_ms)
+    
+    def drain(self) -> Dict[str, Dict[str, Any]]:
+        """Return and reset the aggregated counts."""
+        with self._lock:
+            summary, self._summary = self._summary, {}
+        for entry in summary.values():
+            timed = entry.pop("timed")
+            entry["avg_ms"] = round(entry["total_ms"] / timed, 3) if timed else None
+            entry["total_ms"] = round(entry["total_ms"], 3)
+            entry["max_ms"] = round(entry["max_ms"], 3)
+        return summary
+
+
+# Per-process sampler shared by all loggers
+interaction_sampler = InteractionSampler()
+
+
 class StructuredLogger:
     """Structured logger for test automation."""
     
@@ -22,35 +200,15 @@ class StructuredLogger:
             self._setup_handlers()
     
     def _setup_handlers(self) -> None:
-        """Setup log handlers."""
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        
-        # File handler
-        file_handler = logging.FileHandler('reports/automation.log')
-        file_handler.setLevel(logging.DEBUG)
-        
-        # Formatter
-        formatter = logging.Formatter(settings.LOG_FORMAT)
-        console_handler.setFormatter(formatter)
-        file_handler.setFormatter(formatter)
-        
-        # Add handlers
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        """Attach the shared queue handler; all loggers write through one listener."""
+        self.logger.addHandler(get_queue_handler())
     
     def _log_structured(self, level: str, message: str, **kwargs) -> None:
-        """Log structured message."""
-        log_data = {
-            "timestamp": datetime.now().isoformat(),
-            "level": level,
-            "message": message,
-            **kwargs
-        }
-        
-        log_message = json.dumps(log_data, ensure_ascii=False)
-        getattr(self.logger, level.lower())(log_message)
+        """Log structured message; serialization is deferred to the listener thread."""
+        levelno = getattr(logging, level)
+        if not self.logger.isEnabledFor(levelno):
+            return
+        self.logger.log(levelno, StructuredMessage(level, message, kwargs))
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
@@ -111,18 +269,44 @@ class StructuredLogger:
             url=url
         )
     
-    def log_element_interaction(self, action: str, element: str, value: str = None) -> None:
-        """Log element interaction event."""
+    def log_element_interaction(self, action: str, element: str, value: str = None,
+                                duration: float = None) -> None:
+        """Log element interaction event, sampled or aggregated per INTERACTION_LOG_MODE."""
+        sampler = interaction_sampler
+        if sampler.mode == "aggregate":
+            sampler.record("element_interaction", action, duration)
+            return
+        if not self.logger.isEnabledFor(logging.DEBUG) or not sampler.should_log("element_interaction"):
+            return
         self.debug(
             "Element interaction",
             event="element_interaction",
             action=action,
             element=element,
-            value=value
+            value=value,
+            duration=duration
         )
     
     def log_assertion(self, assertion_type: str, expected: Any, actual: Any, result: bool) -> None:
-        """Log assertion event."""
+        """Log assertion event; failures go out at WARNING and are never sampled away."""
+        sampler = interaction_sampler
+        if sampler.mode == "aggregate":
+            sampler.record("assertion", assertion_type, failed=not result)
+        if not result:
+            self.warning(
+                "Assertion failed",
+                event="assertion",
+                assertion_type=assertion_type,
+                expected=expected,
+                actual=actual,
+                result=result
+            )
+            return
+        # Passing assertions are hot-path noise: DEBUG only, sampled
+        if sampler.mode == "aggregate" or not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        if not sampler.should_log("assertion"):
+            return
         self.debug(
             "Assertion",
             event="assertion",
@@ -132,6 +316,12 @@ class StructuredLogger:
             result=result
         )
     
+    def log_interaction_summary(self, test_name: str) -> None:
+        """Log the interactions aggregated since the last summary, one line per test."""
+        summary = interaction_sampler.drain()
+        if summary:
+            self.info("Interaction summary", event="interaction_summary", test_name=test_name, interactions=summary)
+    
     def log_performance(self, operation: str, duration: float, **metrics) -> None:
         """Log performance metrics."""
         self.info(
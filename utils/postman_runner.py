@@ -0,0 +1,345 @@
+"""
+Python runner for the Postman collection in postman_tests/.
+
+Runs M independent iterations of the collection concurrently, each with its
+own variable scope, through the pooled APIHelper. The pre-request and test
+script statements the collection uses are interpreted directly:
+
+    pm.environment.set("name", "prefix_" + Math.floor(Math.random() * N));
+    pm.environment.set("name", jsonData.field.list[0].key);
+    pm.test("name", function () { pm.response.to.have.status(201); });
+    pm.test("name", function () { pm.expect(jsonData.token).to.not.be.empty; });
+
+Other statements are reported once and skipped.
+
+Usage:
+    python -m utils.postman_runner --iterations 20 --concurrency 5
+    python -m utils.postman_runner --local-stub
+"""
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http import HTTPStatus
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlsplit
+from utils.helpers import APIHelper, PerformanceHelper
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+POSTMAN_DIR = "postman_tests"
+COLLECTION_FILE = os.path.join(POSTMAN_DIR, "DemoQA_API_Challenge.postman_collection.json")
+ENVIRONMENT_FILE = os.path.join(POSTMAN_DIR, "DemoQA_Environment.postman_environment.json")
+OUTPUT_FILE = os.path.join("reports", "postman_run.json")
+
+_VARIABLE = re.compile(r"\{\{\s*([$\w.-]+)\s*\}\}")
+_SET = re.compile(r"pm\.(?:environment|variables|collectionVariables|globals)\.set\(\s*[\"'](\w+)[\"']\s*,\s*(.+?)\s*\)\s*;?$")
+_TEST = re.compile(r"pm\.test\(\s*[\"']([^\"']+)[\"']\s*,\s*function\s*\(\)\s*\{(.*?)\}\s*\)\s*;?", re.S)
+_STATUS = re.compile(r"pm\.response\.to\.have\.status\((\d+)\)")
+_NOT_EMPTY = re.compile(r"pm\.expect\((.+?)\)\.to\.not\.be\.empty")
+_TOKEN = re.compile(r"\s*(\"[^\"]*\"|'[^']*'|Math\.floor\(Math\.random\(\)\s*\*\s*(\d+)\)|Date\.now\(\)|jsonData[\w.\[\]]*|\d+)\s*(\+|$)")
+_PATH_PART = re.compile(r"\.(\w+)|\[(\d+)\]")
+_IGNORED = re.compile(r"^(let|const|var) jsonData = pm\.response\.json\(\);?$|^$")
+
+
+class CollectionRunner:
+    """Runs a Postman v2.1 collection with concurrent, isolated iterations."""
+
+    def __init__(self, collection: Dict[str, Any], environment: Dict[str, Any] = None, base_url: str = None):
+        """Initialize with parsed collection and environment JSON."""
+        self.collection = collection
+        self.requests = collection["item"]
+        self.variables = {
+            value["key"]: value.get("value", "")
+            for value in (environment or {}).get("values", []) if value.get("enabled", True)
+        }
+        self.variables.update({v["key"]: v.get("value", "") for v in collection.get("variable", [])})
+        # Redirect the collection's host, e.g. to the local stand-in
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self._local = threading.local()
+        self._helpers: List[APIHelper] = []
+        self._unsupported = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_files(cls, collection_path: str = COLLECTION_FILE, environment_path: str = ENVIRONMENT_FILE,
+                   base_url: str = None) -> "CollectionRunner":
+        """Load the collection and environment exports."""
+        with open(collection_path, 'r', encoding='utf-8') as f:
+            collection = json.load(f)
+        environment = None
+        if environment_path and os.path.exists(environment_path):
+            with open(environment_path, 'r', encoding='utf-8') as f:
+                environment = json.load(f)
+        return cls(collection, environment, base_url)
+
+    def _api(self) -> APIHelper:
+        """One pooled APIHelper per worker thread, reused across its iterations."""
+        api = getattr(self._local, "api", None)
+        if api is None:
+            api = self._local.api = APIHelper(base_url="", pool_size=4)
+            with self._lock:
+                self._helpers.append(api)
+        return api
+
+    def _close_helpers(self) -> None:
+        """Close the worker threads' connection pools once the run's threads are done."""
+        with self._lock:
+            helpers, self._helpers = self._helpers, []
+        for api in helpers:
+            api.close()
+
+    @staticmethod
+    def resolve(text: str, scope: Dict[str, str]) -> str:
+        """Replace {{variables}} and the {{$guid}}/{{$timestamp}}/{{$randomInt}} built-ins."""
+        def replace(match):
+            name = match.group(1)
+            if name == "$guid":
+                return str(uuid.uuid4())
+            if name == "$timestamp":
+                return str(int(time.time()))
+            if name == "$randomInt":
+                return str(random.randint(0, 1000))
+            return str(scope.get(name, match.group(0)))
+        return _VARIABLE.sub(replace, text)
+
+    def _warn_unsupported(self, statement: str) -> None:
+        """Log each unsupported script statement once."""
+        with self._lock:
+            if statement in self._unsupported:
+                return
+            self._unsupported.add(statement)
+        logger.warning(f"Unsupported Postman script statement skipped: {statement}")
+
+    @staticmethod
+    def _json_path(expression: str, json_data: Any) -> Any:
+        """Evaluate jsonData.a.b[0].c against the response body."""
+        value = json_data
+        for key, index in _PATH_PART.findall(expression[len("jsonData"):]):
+            value = value[int(index)] if index else value[key]
+        return value
+
+    def _evaluate(self, expression: str, json_data: Any) -> Any:
+        """Evaluate a '+'-joined expression of literals, random numbers, Date.now() and jsonData paths."""
+        parts, position = [], 0
+        while position < len(expression):
+            match = _TOKEN.match(expression, position)
+            if not match or match.end() == position:
+                raise ValueError(f"Unsupported expression: {expression}")
+            token, bound = match.group(1), match.group(2)
+            if token[0] in "\"'":
+                parts.append(token[1:-1])
+            elif bound:
+                parts.append(int(random.random() * int(bound)))
+            elif token == "Date.now()":
+                parts.append(int(time.time() * 1000))
+            elif token.startswith("jsonData"):
+                parts.append(self._json_path(token, json_data))
+            else:
+                parts.append(int(token))
+            position = match.end()
+        if len(parts) == 1:
+            return parts[0]
+        return "".join(str(part) for part in parts)
+
+    def _script(self, item: Dict[str, Any], listen: str) -> str:
+        """Source of an item's prerequest or test script."""
+        for event in item.get("event", []):
+            if event.get("listen") == listen:
+                return "\n".join(line.rstrip("\r") for line in event["script"].get("exec", []))
+        return ""
+
+    def _run_statements(self, source: str, scope: Dict[str, str], json_data: Any) -> None:
+        """Apply the variable assignments in a script."""
+        for statement in source.split("\n"):
+            statement = statement.strip()
+            match = _SET.match(statement)
+            if match:
+                try:
+                    scope[match.group(1)] = self._evaluate(match.group(2), json_data)
+                except (KeyError, IndexError, TypeError, ValueError) as e:
+                    logger.warning(f"Could not set {match.group(1)}: {e}")
+            elif not _IGNORED.match(statement) and not statement.startswith(("pm.test", "pm.response", "pm.expect", "});", "//")):
+                self._warn_unsupported(statement)
+
+    def _run_tests(self, source: str, status_code: int, json_data: Any) -> Dict[str, bool]:
+        """Evaluate pm.test blocks against the response."""
+        results = {}
+        for name, body in _TEST.findall(source):
+            passed, checked = True, False
+            for expected in _STATUS.findall(body):
+                passed = passed and status_code == int(expected)
+                checked = True
+            for expression in _NOT_EMPTY.findall(body):
+                try:
+                    value = self._evaluate(expression.strip(), json_data)
+                except (KeyError, IndexError, TypeError, ValueError):
+                    value = None
+                passed = passed and value not in (None, "", [], {})
+                checked = True
+            if not checked:
+                self._warn_unsupported(f"pm.test(\"{name}\") assertions")
+                continue
+            results[name] = passed
+        return results
+
+    def _build(self, item: Dict[str, Any], scope: Dict[str, str]) -> Tuple[str, str, Dict[str, Any]]:
+        """Resolve method, URL, headers, auth and body for one request."""
+        request = item["request"]
+        url = self.resolve(request["url"]["raw"] if isinstance(request["url"], dict) else request["url"], scope)
+        if self.base_url:
+            parts = urlsplit(url)
+            url = f"{self.base_url}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+        headers = {h["key"]: self.resolve(h["value"], scope) for h in request.get("header", []) if not h.get("disabled")}
+        auth = request.get("auth", {})
+        if auth.get("type") == "bearer":
+            token = next((entry["value"] for entry in auth.get("bearer", []) if entry["key"] == "token"), "")
+            headers["Authorization"] = f"Bearer {self.resolve(token, scope)}"
+
+        kwargs: Dict[str, Any] = {"headers": headers}
+        body = request.get("body") or {}
+        if body.get("mode") == "raw" and body.get("raw") and request["method"] not in ("GET", "HEAD"):
+            kwargs["data"] = self.resolve(body["raw"], scope).encode("utf-8")
+            if body.get("options", {}).get("raw", {}).get("language") == "json":
+                headers.setdefault("Content-Type", "application/json")
+        return request["method"], url, kwargs
+
+    def run_iteration(self, iteration: int) -> List[Dict[str, Any]]:
+        """Run every request once with a fresh copy of the variables."""
+        scope = dict(self.variables)
+        api = self._api()
+        executions = []
+        for item in self.requests:
+            self._run_statements(self._script(item, "prerequest"), scope, None)
+            method, url, kwargs = self._build(item, scope)
+            start = time.perf_counter_ns()
+            try:
+                response = api.request(method, url, **kwargs)
+            except Exception as e:
+                elapsed_ns = time.perf_counter_ns() - start
+                logger.error(f"Iteration {iteration}: {item['name']} failed: {e}")
+                executions.append({"name": item["name"], "url": url, "time_ns": elapsed_ns,
+                                   "code": None, "tests": {}, "error": str(e)})
+                continue
+            elapsed_ns = time.perf_counter_ns() - start
+
+            try:
+                json_data = response.json()
+            except ValueError:
+                json_data = None
+            tests_source = self._script(item, "test")
+            self._run_statements(tests_source, scope, json_data)
+            executions.append({
+                "name": item["name"],
+                "url": url,
+                "time_ns": elapsed_ns,
+                "code": response.status_code,
+                "tests": self._run_tests(tests_source, response.status_code, json_data)
+            })
+        return executions
+
+    def run(self, iterations: int = 1, concurrency: int = 1) -> Dict[str, Any]:
+        """Run the iterations on a thread pool and aggregate a Postman-style run report."""
+        started_at = datetime.utcnow()
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                runs = list(executor.map(self.run_iteration, range(iterations)))
+        finally:
+            self._close_helpers()
+        total_time = time.perf_counter() - start
+
+        performance = PerformanceHelper()
+        results: Dict[str, Dict[str, Any]] = {}
+        for executions in runs:
+            for execution in executions:
+                name = execution["name"]
+                performance.record(name, execution["time_ns"])
+                result = results.setdefault(name, {
+                    "name": name, "url": execution["url"], "responseCodes": {},
+                    "testPassFailCounts": {}, "times": [], "errors": 0
+                })
+                code = execution["code"]
+                try:
+                    code_key = f"{code} {HTTPStatus(code).phrase}"
+                except ValueError:
+                    code_key = str(code)
+                result["responseCodes"][code_key] = result["responseCodes"].get(code_key, 0) + 1
+                result["times"].append(round(execution["time_ns"] / 1e6))
+                result["errors"] += 1 if "error" in execution else 0
+                for test, passed in execution["tests"].items():
+                    counts = result["testPassFailCounts"].setdefault(test, {"pass": 0, "fail": 0})
+                    counts["pass" if passed else "fail"] += 1
+
+        summary = performance.summary()
+        for name, result in results.items():
+            result["latency"] = summary[name]
+            result["tests"] = {test: counts["fail"] == 0 for test, counts in result["testPassFailCounts"].items()}
+
+        total_pass = sum(c["pass"] for r in results.values() for c in r["testPassFailCounts"].values())
+        total_fail = sum(c["fail"] for r in results.values() for c in r["testPassFailCounts"].values())
+        total_fail += sum(r["errors"] for r in results.values())
+        report = {
+            "name": self.collection["info"]["name"],
+            "startedAt": started_at.isoformat() + "Z",
+            "count": iterations,
+            "concurrency": concurrency,
+            "totalPass": total_pass,
+            "totalFail": total_fail,
+            "totalTime": round(total_time * 1000),
+            "requestsPerSecond": round(sum(len(r) for r in runs) / total_time, 2) if total_time else 0.0,
+            "results": list(results.values())
+        }
+        logger.info(
+            f"{iterations} iterations x {len(self.requests)} requests in {total_time:.2f}s: "
+            f"{total_pass} passed, {total_fail} failed"
+        )
+        for name, result in results.items():
+            latency = result["latency"]
+            logger.info(f"{name}: p50 {latency['p50_ms']} ms, p90 {latency['p90_ms']} ms, p99 {latency['p99_ms']} ms")
+        return report
+
+
+def main(argv: List[str] = None) -> int:
+    """Run the collection from the command line and write reports/postman_run.json."""
+    parser = argparse.ArgumentParser(description="Run the Postman collection with concurrent iterations")
+    parser.add_argument("--collection", default=COLLECTION_FILE)
+    parser.add_argument("--environment", default=ENVIRONMENT_FILE)
+    parser.add_argument("--iterations", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--base-url", help="send requests to this host instead of the collection's")
+    parser.add_argument("--local-stub", action="store_true", help="run against the local DemoQA stand-in")
+    parser.add_argument("--output", default=OUTPUT_FILE)
+    args = parser.parse_args(argv)
+
+    stub: Optional[Any] = None
+    base_url = args.base_url
+    if args.local_stub:
+        from utils.demoqa_stub import DemoQAStubServer
+        stub = DemoQAStubServer().start()
+        base_url = stub.url
+    try:
+        runner = CollectionRunner.from_files(args.collection, args.environment, base_url)
+        report = runner.run(args.iterations, args.concurrency)
+    finally:
+        if stub:
+            stub.stop()
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    logger.info(f"Run report written to {args.output}")
+    return 1 if report["totalFail"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
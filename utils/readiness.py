@@ -0,0 +1,154 @@
+"""
+App-aware page readiness and page-load strategy comparison.
+
+Instead of waiting for the window load event (which includes every ad
+iframe), readiness is reached once the app root and the route's key
+locators exist.
+"""
+import os
+import json
+import time
+import statistics
+from typing import Any, Callable, Dict, List, Sequence
+from urllib.parse import urlsplit
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from config.settings import settings
+from utils.logger import get_logger
+from utils.waits import APP_ROOT, WaitEngine
+
+logger = get_logger(__name__)
+
+
+# Route path -> locators that must exist before the page is usable
+READY_LOCATORS: Dict[str, List[str]] = {
+    "/": [APP_ROOT, ".card"],
+    "/automation-practice-form": [APP_ROOT, "#userForm", "#submit"],
+    "/webtables": [APP_ROOT, ".rt-table", "#addNewRecordButton"],
+    "/progress-bar": [APP_ROOT, ".progress-bar", "#startStopButton"],
+    "/browser-windows": [APP_ROOT, "#windowButton"],
+    "/sample": ["#sampleHeading"],
+    "/login": [APP_ROOT, "#userName", "#login"],
+    "/books": [APP_ROOT, ".rt-table"],
+    "/profile": [APP_ROOT],
+}
+
+
+def _path_of(url_or_path: str) -> str:
+    """Route path of a URL, without trailing slash."""
+    path = urlsplit(url_or_path).path or "/"
+    return path.rstrip("/") or "/"
+
+
+class ReadinessDetector:
+    """Waits until the app's own markup for a route is in place."""
+
+    def __init__(self, driver, timeout: float = None, locators: Dict[str, List[str]] = None):
+        """Initialize with WebDriver instance."""
+        self.driver = driver
+        self.timeout = timeout or settings.TIMEOUT
+        self.locators = READY_LOCATORS if locators is None else locators
+
+    def condition_for(self, path: str) -> str:
+        """JavaScript expression that is true once the route is ready."""
+        checks = [f"location.pathname.replace(/\\/$/, '') === {json.dumps(path.rstrip('/'))}",
+                  "document.readyState !== 'loading'"]
+        checks += [f"!!document.querySelector({json.dumps(selector)})" for selector in self.locators.get(path, [])]
+        return " && ".join(checks)
+
+    def wait_until_ready(self, url_or_path: str = None) -> float:
+        """Wait for the route (default: the current URL) and return the seconds waited."""
+        path = _path_of(url_or_path or self.driver.current_url)
+        condition = self.condition_for(path)
+        deadline = time.perf_counter() + self.timeout
+        start = time.perf_counter()
+        while True:
+            remaining = deadline - time.perf_counter()
+            try:
+                WaitEngine(self.driver).wait_for_js_condition(condition, timeout=max(remaining, 0.001))
+                elapsed = time.perf_counter() - start
+                logger.debug(f"Route {path} ready after {elapsed:.3f}s")
+                return elapsed
+            except WebDriverException as e:
+                # With eager/none strategies the script may run while the document is being replaced
+                if isinstance(e, TimeoutException) or time.perf_counter() >= deadline:
+                    raise
+                logger.debug(f"Document changed while waiting for {path}: {e.msg}")
+
+
+def compare_page_load_strategies(driver_factory: Callable[[str], Any], urls: Sequence[str],
+                                 strategies: Sequence[str] = ("normal", "eager", "none"),
+                                 repeats: int = 3, output_path: str = None) -> Dict[str, Any]:
+    """
+    Time each page under each page-load strategy.
+
+    driver_factory receives a strategy name and returns a new driver. For every
+    URL the median time until driver.get returned and until the route was ready
+    is recorded, along with the fastest strategy that reached readiness on every
+    repeat.
+    """
+    results: Dict[str, Dict[str, Any]] = {url: {} for url in urls}
+    for strategy in strategies:
+        driver = driver_factory(strategy)
+        try:
+            detector = ReadinessDetector(driver)
+            for url in urls:
+                returned, ready, failures = [], [], 0
+                for _ in range(repeats):
+                    driver.get("about:blank")
+                    start = time.perf_counter()
+                    driver.get(url)
+                    returned.append(time.perf_counter() - start)
+                    try:
+                        detector.wait_until_ready(url)
+                        ready.append(time.perf_counter() - start)
+                    except TimeoutException:
+                        failures += 1
+                results[url][strategy] = {
+                    "get_returned": statistics.median(returned),
+                    "app_ready": statistics.median(ready) if ready else None,
+                    "failures": failures
+                }
+        finally:
+            driver.quit()
+
+    for url, timings in results.items():
+        safe = {name: t["app_ready"] for name, t in timings.items() if t["failures"] == 0 and t["app_ready"]}
+        timings["fastest_safe"] = min(safe, key=safe.get) if safe else None
+        summary = ", ".join(
+            f"{name}: get {t['get_returned']:.2f}s / ready {t['app_ready'] or float('nan'):.2f}s"
+            for name, t in timings.items() if name != "fastest_safe"
+        )
+        logger.info(f"{url} -> {summary}; fastest safe: {timings['fastest_safe']}")
+
+    output_path = output_path or os.path.join("reports", "page_load_strategies.json")
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    return results
+
+
+def _chrome_factory(strategy: str):
+    """Chrome driver with the project options and the given page-load strategy."""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.chrome.options import Options
+    from utils.driver_resolver import resolve_chromedriver
+    from utils.request_blocking import request_blocker
+
+    options = Options()
+    for arg in settings.get_browser_options().get("args", []):
+        options.add_argument(arg)
+    options.page_load_strategy = strategy
+    request_blocker.configure_options(options)
+    driver = webdriver.Chrome(service=Service(resolve_chromedriver()), options=options)
+    request_blocker.apply(driver)
+    return driver
+
+
+if __name__ == "__main__":
+    compare_page_load_strategies(_chrome_factory, [
+        settings.BASE_URL,
+        settings.FORM_URL,
+        settings.WEB_TABLES_URL,
+        settings.PROGRESS_BAR_URL,
+    ])
@@ -0,0 +1,137 @@
+"""
+Ad and tracker request blocking through Chrome DevTools.
+"""
+import os
+import glob
+import json
+import threading
+from typing import Dict, Any, List
+from urllib.parse import urlsplit
+from config.settings import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+REPORT_DIR = "reports"
+
+
+class RequestBlocker:
+    """Applies the configured URL blocklist and counts what it blocked."""
+
+    def __init__(self, patterns: List[str] = None):
+        """Initialize with URL patterns, defaulting to the environment config."""
+        self.patterns = settings.BLOCKED_URL_PATTERNS if patterns is None else patterns
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            "blocked_requests": 0,
+            "blocked_by_host": {},
+            "completed_requests": 0,
+            "bytes_transferred": 0
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.patterns)
+
+    def configure_options(self, options) -> None:
+        """Enable the network performance log needed for the counters."""
+        if not self.enabled:
+            return
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    def apply(self, driver) -> None:
+        """Block the configured URLs for every page loaded by this driver."""
+        if not self.enabled:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+        logger.debug(f"Blocking {len(self.patterns)} URL patterns")
+
+    def collect(self, driver) -> Dict[str, Any]:
+        """Drain the driver's network log into the per-run counters."""
+        if not self.enabled:
+            return self.stats
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            logger.debug(f"Performance log unavailable: {e}")
+            return self.stats
+
+        urls = {}
+        blocked = 0
+        blocked_hosts: Dict[str, int] = {}
+        completed = 0
+        transferred = 0
+        for entry in entries:
+            message = json.loads(entry["message"])["message"]
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                blocked += 1
+                host = urlsplit(urls.get(params["requestId"], "")).hostname or "unknown"
+                blocked_hosts[host] = blocked_hosts.get(host, 0) + 1
+            elif method == "Network.loadingFinished":
+                completed += 1
+                transferred += int(params.get("encodedDataLength", 0))
+
+        return self.merge({
+            "blocked_requests": blocked,
+            "blocked_by_host": blocked_hosts,
+            "completed_requests": completed,
+            "bytes_transferred": transferred
+        })
+
+    def merge(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        """Add another driver's or process's counters to these."""
+        with self._lock:
+            self.stats["blocked_requests"] += stats["blocked_requests"]
+            self.stats["completed_requests"] += stats["completed_requests"]
+            self.stats["bytes_transferred"] += stats["bytes_transferred"]
+            for host, count in stats["blocked_by_host"].items():
+                self.stats["blocked_by_host"][host] = self.stats["blocked_by_host"].get(host, 0) + count
+        return self.stats
+
+    def report(self, path: str = None) -> Dict[str, Any]:
+        """
+        Log the counters and write them to reports/request_blocking.json.
+
+        A run_parallel shard writes request_blocking-<shard>.json instead;
+        merge_reports() combines those once every shard is done.
+        """
+        if not self.enabled:
+            return self.stats
+        worker = settings.get_worker_id()
+        name = "request_blocking.json" if worker == "master" else f"request_blocking-{worker}.json"
+        path = path or os.path.join(REPORT_DIR, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.stats, f, indent=2)
+        logger.info(
+            f"Blocked {self.stats['blocked_requests']} requests; "
+            f"{self.stats['bytes_transferred']} bytes transferred by {self.stats['completed_requests']} allowed requests"
+        )
+        return self.stats
+
+
+def merge_reports(directory: str = REPORT_DIR) -> Dict[str, Any]:
+    """Merge per-shard request_blocking-*.json files into request_blocking.json."""
+    merged = RequestBlocker(patterns=[])
+    shard_files = sorted(glob.glob(os.path.join(directory, "request_blocking-*.json")))
+    if not shard_files:
+        return merged.stats
+    for shard_file in shard_files:
+        with open(shard_file, 'r', encoding='utf-8') as f:
+            merged.merge(json.load(f))
+        os.remove(shard_file)
+    with open(os.path.join(directory, "request_blocking.json"), 'w', encoding='utf-8') as f:
+        json.dump(merged.stats, f, indent=2)
+    logger.info(f"Merged request blocking counters of {len(shard_files)} shards: "
+                f"{merged.stats['blocked_requests']} requests blocked")
+    return merged.stats
+
+
+# Per-process blocker shared by pytest and behave
+request_blocker = RequestBlocker()
@@ -0,0 +1,114 @@
+"""
+Route registry for navigating straight to DemoQA pages.
+
+Each logical page maps to its path, the ready-locators checked by
+ReadinessDetector and the home card / side-menu labels used when the
+page is reached through the UI instead of a deep link.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from config.settings import settings
+from utils.logger import get_logger
+from utils.readiness import READY_LOCATORS, ReadinessDetector
+from utils.waits import WaitEngine
+
+logger = get_logger(__name__)
+
+NAVIGATION_MODES = ("deeplink", "ui")
+
+
+@dataclass(frozen=True)
+class Route:
+    """A page reachable by URL or through the home card and side menu."""
+    name: str
+    path: str
+    card: Optional[str] = None
+    menu_item: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"{settings.BASE_URL}{self.path}"
+
+    @property
+    def ready_locators(self) -> List[str]:
+        return READY_LOCATORS.get(self.path, [])
+
+
+ROUTES: Dict[str, Route] = {route.name: route for route in [
+    Route("home", "/"),
+    Route("practice_form", "/automation-practice-form", "Forms", "Practice Form"),
+    Route("web_tables", "/webtables", "Elements", "Web Tables"),
+    Route("progress_bar", "/progress-bar", "Widgets", "Progress Bar"),
+    Route("browser_windows", "/browser-windows", "Alerts, Frame & Windows", "Browser Windows"),
+    Route("login", "/login", "Book Store Application", "Login"),
+    Route("books", "/books", "Book Store Application", "Book Store"),
+    Route("profile", "/profile", "Book Store Application", "Profile"),
+]}
+
+
+def get_route(name: str) -> Route:
+    """Look up a route by logical name."""
+    try:
+        return ROUTES[name]
+    except KeyError:
+        raise ValueError(f"Unknown route: {name}. Available: {sorted(ROUTES)}")
+
+
+class Router:
+    """Opens routes by deep link, or by clicking through home when mode is 'ui'."""
+
+    def __init__(self, driver, mode: str = None, timeout: int = None):
+        """Initialize with WebDriver instance and navigation mode."""
+        mode = (mode or settings.NAVIGATION_MODE).lower()
+        if mode not in NAVIGATION_MODES:
+            raise ValueError(f"Unsupported navigation mode: {mode}")
+        self.driver = driver
+        self.mode = mode
+        self.timeout = timeout or settings.TIMEOUT
+        self.wait = WebDriverWait(driver, self.timeout)
+        self.readiness = ReadinessDetector(driver, self.timeout)
+
+    @property
+    def deep_link(self) -> bool:
+        return self.mode == "deeplink"
+
+    def open_home(self) -> None:
+        """Open the home page; deferred in deep-link mode, where the target is opened directly."""
+        if self.deep_link:
+            logger.debug("Deep-link navigation: skipping home page")
+            return
+        self.go("home")
+
+    def go(self, name: str) -> float:
+        """Load a route by URL and return the seconds until it was ready."""
+        route = get_route(name)
+        self.driver.get(route.url)
+        elapsed = self.readiness.wait_until_ready(route.path)
+        logger.info(f"Opened {route.name} via deep link in {elapsed:.2f}s")
+        return elapsed
+
+    def click_card(self, card: str) -> None:
+        """Click a home card; a no-op in deep-link mode."""
+        if self.deep_link:
+            return
+        self._click((By.XPATH, f"//h5[text()='{card}']"))
+        WaitEngine(self.driver, self.timeout).wait_for_dom_stable()
+
+    def open(self, name: str) -> None:
+        """Reach a route: by deep link, or through its side-menu item in UI mode."""
+        route = get_route(name)
+        if self.deep_link:
+            self.go(name)
+            return
+        self._click((By.XPATH, f"//span[text()='{route.menu_item}']"))
+        self.readiness.wait_until_ready(route.path)
+        logger.info(f"Opened {route.name} via UI")
+
+    def _click(self, locator) -> None:
+        """Scroll an element into view and click it."""
+        element = self.wait.until(EC.presence_of_element_located(locator))
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self.wait.until(EC.element_to_be_clickable(locator)).click()
@@ -0,0 +1,154 @@
+"""
+Background, content-addressed screenshot writer.
+
+A capture costs the test thread a single screenshot call; decoding and
+disk writes happen on a writer thread. Files are named by content hash,
+so identical images (e.g. the same error page on several failures) are
+stored once. The name index is merged into one index.json shared by all
+xdist workers and BDD shards, and describes the current run only.
+"""
+import os
+import json
+import base64
+import queue
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from config.settings import settings
+from utils.file_lock import file_lock
+from utils.helpers import DataHelper
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_STOP = object()
+
+
+class ScreenshotWriter:
+    """Queues screenshots and writes each distinct image once."""
+
+    def __init__(self, directory: str = None, max_pending: int = 32):
+        """Initialize with the output directory."""
+        self.directory = directory or settings.SCREENSHOT_PATH
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._digests = set()
+        self.index: List[Dict[str, Any]] = []
+        self._flushed = 0
+        self.stats = {"captured": 0, "written": 0, "duplicates": 0, "errors": 0}
+
+    def _ensure_started(self) -> None:
+        """Start the writer thread on first use."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            os.makedirs(self.directory, exist_ok=True)
+            self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+            self._thread.start()
+
+    def capture(self, driver, name: str) -> str:
+        """
+        Take one screenshot and queue it for writing.
+
+        Returns the path the image will have once written; a duplicate of an
+        earlier image returns the existing file's path without queueing.
+        """
+        return self._queue_image(driver.get_screenshot_as_base64(), name)
+
+    def capture_png(self, driver, name: str) -> Tuple[str, bytes]:
+        """Like capture(), also returning the PNG bytes for report attachments."""
+        encoded = driver.get_screenshot_as_base64()
+        return self._queue_image(encoded, name), base64.b64decode(encoded)
+
+    def _queue_image(self, encoded: str, name: str) -> str:
+        """Record the image in the index and queue it unless already stored."""
+        digest = DataHelper.generate_hash(encoded)
+        path = os.path.join(self.directory, f"{digest}.png")
+
+        with self._lock:
+            self.stats["captured"] += 1
+            self.index.append({"name": name, "file": os.path.basename(path)})
+            duplicate = digest in self._digests
+            self._digests.add(digest)
+            if duplicate:
+                self.stats["duplicates"] += 1
+
+        if duplicate:
+            logger.debug(f"Screenshot {name} identical to {path}, not written again")
+        else:
+            self._ensure_started()
+            self._queue.put((encoded, path))
+        return path
+
+    def _run(self) -> None:
+        """Decode and write queued images until stopped."""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is _STOP:
+                    return
+                encoded, path = item
+                if os.path.exists(path):
+                    with self._lock:
+                        self.stats["duplicates"] += 1
+                    continue
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(base64.b64decode(encoded))
+                os.replace(tmp_path, path)
+                with self._lock:
+                    self.stats["written"] += 1
+            except Exception as e:
+                with self._lock:
+                    self.stats["errors"] += 1
+                logger.error(f"Failed to write screenshot: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self) -> Dict[str, Any]:
+        """Wait for queued images, merge new names into the index and return the counters."""
+        if self._thread and self._thread.is_alive():
+            self._queue.join()
+        with self._lock:
+            entries = self.index[self._flushed:]
+            self._flushed = len(self.index)
+        if entries:
+            self._merge_index(entries)
+        logger.info(
+            f"Screenshots: {self.stats['captured']} captured, {self.stats['written']} written, "
+            f"{self.stats['duplicates']} duplicates skipped"
+        )
+        return self.stats
+
+    def _merge_index(self, entries: List[Dict[str, Any]]) -> None:
+        """Add entries to index.json under a file lock shared by every process; earlier runs are dropped."""
+        index_path = os.path.join(self.directory, "index.json")
+        run_id = settings.get_run_id()
+        with file_lock(f"{index_path}.lock"):
+            index = {"run_id": run_id, "screenshots": []}
+            if os.path.exists(index_path):
+                try:
+                    with open(index_path, 'r', encoding='utf-8') as f:
+                        existing = json.load(f)
+                    if isinstance(existing, dict) and existing.get("run_id") == run_id:
+                        index = existing
+                except ValueError:
+                    logger.warning(f"Replacing unreadable screenshot index {index_path}")
+            index["screenshots"].extend(entries)
+            tmp_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2, ensure_ascii=False)
+            os.replace(tmp_path, index_path)
+
+    def close(self) -> Dict[str, Any]:
+        """Flush and stop the writer thread."""
+        stats = self.flush()
+        if self._thread and self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._thread = None
+        return stats
+
+
+# Per-process writer shared by pytest and behave
+screenshot_writer = ScreenshotWriter()
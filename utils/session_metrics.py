@@ -0,0 +1,106 @@
+"""
+Session-level test outcomes and latency histograms, mergeable across xdist workers.
+
+Each worker records its outcomes and performance_helper histograms locally
+and ships them to the controller as JSON; the controller merges them into
+one summary, so percentiles come from merged buckets rather than raw samples.
+"""
+import os
+import json
+import time
+from collections import Counter
+from typing import Dict, Any, Optional
+from config.settings import settings
+from utils.helpers import LatencyHistogram, PerformanceHelper
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SessionMetrics:
+    """Outcome counts and latency histograms for one pytest process or a merged run."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.started_at = time.time()
+        self.outcomes: Counter = Counter()
+        self.test_durations = LatencyHistogram()
+        self.performance: Dict[str, LatencyHistogram] = {}
+        self.workers = 0
+
+    def record_outcome(self, outcome: str, duration: Optional[float] = None) -> None:
+        """Count one test outcome and, when given, its call duration in seconds."""
+        self.outcomes[outcome] += 1
+        if duration is not None:
+            self.test_durations.record(int(duration * 1e9))
+
+    def add_performance(self, helper: PerformanceHelper) -> None:
+        """Merge a performance_helper's histograms."""
+        for operation, histogram in helper.histograms.items():
+            self.performance.setdefault(operation, LatencyHistogram()).merge(histogram)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable form, shipped from workers to the controller."""
+        return {
+            "outcomes": dict(self.outcomes),
+            "test_durations": self.test_durations.to_dict(),
+            "performance": {operation: h.to_dict() for operation, h in self.performance.items()}
+        }
+
+    def merge_dict(self, data: Dict[str, Any]) -> None:
+        """Merge the to_dict output of another process."""
+        self.outcomes.update(data["outcomes"])
+        self.test_durations.merge(LatencyHistogram.from_dict(data["test_durations"]))
+        for operation, histogram in data["performance"].items():
+            self.performance.setdefault(operation, LatencyHistogram()).merge(LatencyHistogram.from_dict(histogram))
+        self.workers += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """Outcome totals, throughput and latency percentiles for the run."""
+        wall_time = time.time() - self.started_at
+        # One duration per test; a teardown error adds an outcome but not a test
+        total = self.test_durations.count
+        return {
+            "workers": self.workers or 1,
+            "wall_time_s": round(wall_time, 3),
+            "tests": total,
+            "outcomes": dict(self.outcomes),
+            "throughput_tests_per_s": round(total / wall_time, 3) if wall_time > 0 else 0.0,
+            "test_duration": self.test_durations.summary(),
+            "performance": {operation: h.summary() for operation, h in sorted(self.performance.items())}
+        }
+
+    def write(self, path: str = None) -> Dict[str, Any]:
+        """Write the summary and merged histograms to reports/session_metrics.json."""
+        path = path or os.path.join("reports", "session_metrics.json")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        summary = self.summary()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"summary": summary, "histograms": self.to_dict()}, f, indent=2)
+        return summary
+
+    def write_allure_environment(self, summary: Dict[str, Any], directory: str = None) -> str:
+        """Write the run summary to Allure's environment.properties."""
+        directory = directory or settings.ALLURE_RESULTS_DIR
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, "environment.properties")
+        duration = summary["test_duration"]
+        entries = {
+            "Browser": settings.BROWSER,
+            "Base.URL": settings.BASE_URL,
+            "Environment": settings.ENVIRONMENT,
+            "Workers": summary["workers"],
+            "Tests": summary["tests"],
+            "Outcomes": ", ".join(f"{k}={v}" for k, v in sorted(summary["outcomes"].items())),
+            "Throughput.tests.per.s": summary["throughput_tests_per_s"],
+            "Test.duration.ms": f"p50={duration['p50_ms']} p90={duration['p90_ms']} "
+                                f"p99={duration['p99_ms']} max={duration['max_ms']}"
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            for key, value in entries.items():
+                f.write(f"{key}={value}\n")
+        return path
+
+
+# Per-process metrics; on the xdist controller this holds the merged run
+session_metrics = SessionMetrics()
@@ -0,0 +1,150 @@
+"""
+API-driven state seeding for Book Store UI tests.
+
+Creates the account, token and rented books through the Account/BookStore
+API and injects the resulting auth state into the WebDriver session before
+its first navigation, so profile and bookstore tests start logged in.
+"""
+import json
+import base64
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+from config.settings import settings
+from utils.data_generator import data_generator
+from utils.helpers import APIHelper
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Seeds localStorage on the site's origin for every new document, ahead of the app's scripts
+_LOCAL_STORAGE_SCRIPT = """
+if (location.origin === %(origin)s) {
+    var items = %(items)s;
+    Object.keys(items).forEach(function (key) { localStorage.setItem(key, items[key]); });
+}
+"""
+
+
+@dataclass
+class SeededAccount:
+    """An Account API user with its token and rented books."""
+    username: str
+    password: str
+    user_id: str
+    token: str
+    expires: str
+    books: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def auth_state(self) -> Dict[str, str]:
+        """Cookie and localStorage entries DemoQA's login page would set."""
+        return {"userID": self.user_id, "userName": self.username, "token": self.token, "expires": self.expires}
+
+
+class StateSeeder:
+    """Creates logged-in Book Store state through the API and hands it to a browser."""
+
+    def __init__(self, api: APIHelper = None):
+        """Initialize with an APIHelper; the Account/BookStore API lives at the site root."""
+        self.api = api or APIHelper(base_url=settings.BASE_URL)
+
+    def create_account(self, account: Dict[str, str] = None, isbns: List[str] = None,
+                       book_count: int = 0) -> SeededAccount:
+        """Create a user, generate its token and rent the given ISBNs (or the first book_count books)."""
+        account = account or data_generator.generate_bookstore_account()
+
+        response = self.api.post("/Account/v1/User", account)
+        if response.status_code != 201:
+            raise RuntimeError(f"Could not create user {account['userName']}: {response.status_code} {response.text}")
+        user_id = response.json()["userID"]
+        seeded = SeededAccount(account["userName"], account["password"], user_id, token="", expires="")
+
+        try:
+            response = self.api.post("/Account/v1/GenerateToken", account)
+            token_data = response.json() if response.status_code == 200 else {}
+            if not token_data.get("token"):
+                raise RuntimeError(f"Could not generate token for {account['userName']}: {response.text}")
+            seeded.token, seeded.expires = token_data["token"], token_data["expires"]
+
+            if isbns is None and book_count:
+                catalog = self.api.get("/BookStore/v1/Books").json()["books"]
+                isbns = [book["isbn"] for book in catalog[:book_count]]
+            if isbns:
+                response = self.api.post(
+                    "/BookStore/v1/Books",
+                    {"userId": user_id, "collectionOfIsbns": [{"isbn": isbn} for isbn in isbns]},
+                    headers=self._auth_header(seeded)
+                )
+                if response.status_code != 201:
+                    raise RuntimeError(f"Could not add books to {seeded.username}: {response.status_code} {response.text}")
+                seeded.books = self.api.get(f"/Account/v1/User/{user_id}", headers=self._auth_header(seeded)).json()["books"]
+        except Exception:
+            # Nobody else gets the account, so remove the half-seeded user here
+            self._rollback(seeded)
+            raise
+
+        logger.info(f"Seeded account {seeded.username} with {len(seeded.books)} books")
+        return seeded
+
+    def inject(self, driver, account: SeededAccount) -> Optional[str]:
+        """
+        Put the account's auth cookies and localStorage into the session.
+
+        On Chromium this happens through CDP without navigating, so the first
+        driver.get already runs authenticated; the returned script identifier
+        must be passed to clear(). Other browsers visit a same-origin URL once
+        to set the state the WebDriver way.
+        """
+        state = account.auth_state
+        if hasattr(driver, "execute_cdp_cmd"):
+            for name, value in state.items():
+                driver.execute_cdp_cmd("Network.setCookie", {
+                    "name": name, "value": value, "url": settings.BASE_URL, "path": "/"
+                })
+            script = _LOCAL_STORAGE_SCRIPT % {"origin": json.dumps(settings.BASE_URL), "items": json.dumps(state)}
+            result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+            return result.get("identifier")
+
+        driver.get(f"{settings.BASE_URL}/favicon.ico")
+        for name, value in state.items():
+            driver.add_cookie({"name": name, "value": value, "path": "/"})
+        driver.execute_script(
+            "var items = arguments[0]; Object.keys(items).forEach(function (k) { localStorage.setItem(k, items[k]); });",
+            state
+        )
+        return None
+
+    def clear(self, driver, identifier: Optional[str]) -> None:
+        """Stop seeding localStorage on new documents; cookies go with the driver reset."""
+        if identifier:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": identifier})
+
+    def delete_account(self, account: SeededAccount) -> bool:
+        """Delete the seeded user and return whether the API accepted it."""
+        response = self.api.delete(f"/Account/v1/User/{account.user_id}", headers=self._auth_header(account))
+        if response.status_code not in (200, 204):
+            logger.warning(f"Could not delete seeded user {account.username}: {response.status_code}")
+            return False
+        return True
+
+    def _rollback(self, account: SeededAccount) -> None:
+        """Delete a user whose seeding failed part way, without masking the original error."""
+        try:
+            deleted = self.delete_account(account)
+        except Exception as e:
+            logger.warning(f"Could not delete seeded user {account.username}: {e}")
+            deleted = False
+        if not deleted:
+            logger.error(f"Seeding failed and user {account.username} ({account.user_id}) was left behind")
+
+    def close(self) -> None:
+        """Close pooled API connections."""
+        self.api.close()
+
+    @staticmethod
+    def _auth_header(account: SeededAccount) -> Dict[str, str]:
+        if account.token:
+            return {"Authorization": f"Bearer {account.token}"}
+        # No token yet (GenerateToken failed): the Account API also accepts basic auth
+        credentials = base64.b64encode(f"{account.username}:{account.password}".encode()).decode()
+        return {"Authorization": f"Basic {credentials}"}
@@ -0,0 +1,233 @@
+"""
+Condition-based waits driven by in-page signals.
+
+Each wait returns as soon as its condition holds and reports how long it
+actually waited, so fixed time.sleep calls can be replaced without guessing.
+"""
+import time
+from typing import Any, Dict
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from config.settings import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Resolves once no scroll event has fired for quietMs
+_SCROLL_END_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var start = performance.now(), last = start;
+var onScroll = function () { last = performance.now(); };
+window.addEventListener('scroll', onScroll, true);
+(function check() {
+    var now = performance.now();
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        window.removeEventListener('scroll', onScroll, true);
+        done({satisfied: now - last >= quietMs, elapsed: now - start});
+    } else {
+        setTimeout(check, 16);
+    }
+})();
+"""
+
+# Resolves once the DOM under rootSelector has not mutated for quietMs; mutations
+# inside ad containers (which rotate forever on demoqa.com) do not count
+_DOM_STABLE_SCRIPT = """
+var quietMs = arguments[0], timeoutMs = arguments[1], rootSelector = arguments[2], ignoreSelector = arguments[3];
+var done = arguments[arguments.length - 1];
+var start = performance.now(), last = start;
+var root = (rootSelector && document.querySelector(rootSelector)) || document.documentElement;
+function ignored(record) {
+    var node = record.target.nodeType === 1 ? record.target : record.target.parentElement;
+    return !!(node && ignoreSelector && node.closest(ignoreSelector));
+}
+var observer = new MutationObserver(function (records) {
+    if (!records.every(ignored)) { last = performance.now(); }
+});
+observer.observe(root, {childList: true, subtree: true, attributes: true, characterData: true});
+(function check() {
+    var now = performance.now();
+    if (now - last >= quietMs || now - start >= timeoutMs) {
+        observer.disconnect();
+        done({satisfied: now - last >= quietMs, elapsed: now - start});
+    } else {
+        setTimeout(check, 16);
+    }
+})();
+"""
+
+# Resolves after the given number of animation frames, i.e. once layout and paint have settled
+_ANIMATION_FRAMES_SCRIPT = """
+var frames = arguments[0], done = arguments[arguments.length - 1];
+var start = performance.now();
+(function tick(remaining) {
+    if (remaining <= 0) {
+        done({satisfied: true, elapsed: performance.now() - start});
+    } else {
+        requestAnimationFrame(function () { tick(remaining - 1); });
+    }
+})(frames);
+"""
+
+# Resolves once a JavaScript expression is truthy, checked every animation frame
+_JS_CONDITION_SCRIPT = """
+var expression = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var predicate = new Function('return (' + expression + ');');
+var start = performance.now();
+(function check() {
+    var now = performance.now(), satisfied = false;
+    try { satisfied = !!predicate(); } catch (e) { satisfied = false; }
+    if (satisfied || now - start >= timeoutMs) {
+        done({satisfied: satisfied, elapsed: now - start});
+    } else {
+        requestAnimationFrame(check);
+    }
+})();
+"""
+
+# Resolves the moment a numeric attribute crosses a threshold, optionally clicking
+# a start element before observing and a stop element in the same task as the crossing
+_ATTRIBUTE_WATCH_SCRIPT = """
+var selector = arguments[0], attribute = arguments[1], operator = arguments[2], threshold = arguments[3];
+var startSelector = arguments[4], stopSelector = arguments[5], timeoutMs = arguments[6];
+var done = arguments[arguments.length - 1];
+var target = document.querySelector(selector);
+var start = performance.now(), finished = false, observer = null, timer = null;
+if (!target) {
+    done({satisfied: false, value: null, clicked: false, elapsed: 0, error: 'Element not found: ' + selector});
+    return;
+}
+var compare = {
+    '>=': function (v) { return v >= threshold; },
+    '<=': function (v) { return v <= threshold; },
+    '>': function (v) { return v > threshold; },
+    '<': function (v) { return v < threshold; },
+    '==': function (v) { return v === threshold; }
+}[operator];
+function crossed() { return compare(parseFloat(target.getAttribute(attribute))); }
+function finish(satisfied) {
+    if (finished) { return; }
+    finished = true;
+    if (observer) { observer.disconnect(); }
+    clearTimeout(timer);
+    var value = target.getAttribute(attribute), clicked = false;
+    if (satisfied && stopSelector) {
+        var stopElement = document.querySelector(stopSelector);
+        if (stopElement) { stopElement.click(); clicked = true; }
+    }
+    done({satisfied: satisfied, value: value, clicked: clicked, elapsed: performance.now() - start});
+}
+observer = new MutationObserver(function () { if (crossed()) { finish(true); } });
+observer.observe(target, {attributes: true, attributeFilter: [attribute]});
+timer = setTimeout(function () { finish(false); }, timeoutMs);
+if (startSelector) { document.querySelector(startSelector).click(); }
+if (crossed()) { finish(true); }
+"""
+
+# Selenium's default async script timeout; longer watches must raise it
+DEFAULT_SCRIPT_TIMEOUT = 30
+
+# DemoQA's React root, and the ad slots around it that never stop mutating
+APP_ROOT = "#app"
+AD_CONTAINERS = "iframe, ins.adsbygoogle, [id^='google_ads'], [id^='adplus'], #fixedban, [id^='Ad.Plus']"
+
+
+class WaitEngine:
+    """Event-driven waits for a WebDriver session."""
+
+    def __init__(self, driver, timeout: float = None):
+        """Initialize with WebDriver instance."""
+        self.driver = driver
+        self.timeout = timeout or settings.TIMEOUT
+
+    def _run(self, condition: str, script: str, *args) -> float:
+        """Run an async wait script and return the elapsed seconds."""
+        result: Dict[str, Any] = self.driver.execute_async_script(script, *args)
+        elapsed = result["elapsed"] / 1000
+        if not result["satisfied"]:
+            raise TimeoutException(f"Condition '{condition}' not met after {elapsed:.2f} seconds")
+        logger.debug(f"Waited {elapsed:.3f}s for {condition}")
+        return elapsed
+
+    def wait_for_scroll_end(self, quiet_ms: int = 50, timeout: float = None) -> float:
+        """Wait until scrolling has stopped."""
+        timeout_ms = (timeout or self.timeout) * 1000
+        return self._run("scroll end", _SCROLL_END_SCRIPT, quiet_ms, timeout_ms)
+
+    def wait_for_dom_stable(self, quiet_ms: int = 150, timeout: float = None,
+                            root_selector: str = APP_ROOT, ignore_selector: str = AD_CONTAINERS) -> float:
+        """
+        Wait until the app's DOM stops changing, tolerating a navigation in progress.
+
+        Only the subtree under root_selector (the whole document when it is
+        absent) is observed, and mutations inside ignore_selector are skipped.
+        """
+        timeout = timeout or self.timeout
+        deadline = time.perf_counter() + timeout
+        start = time.perf_counter()
+        while True:
+            remaining_ms = max(0.0, deadline - time.perf_counter()) * 1000
+            try:
+                self._run("DOM stable", _DOM_STABLE_SCRIPT, quiet_ms, remaining_ms, root_selector, ignore_selector)
+                return time.perf_counter() - start
+            except WebDriverException as e:
+                # The document was replaced while observing; observe the new one
+                if isinstance(e, TimeoutException) or time.perf_counter() >= deadline:
+                    raise
+                logger.debug(f"Document changed while waiting for DOM stable: {e.msg}")
+
+    def wait_for_animation_frames(self, frames: int = 2) -> float:
+        """Wait for the given number of animation frames."""
+        return self._run(f"{frames} animation frames", _ANIMATION_FRAMES_SCRIPT, frames)
+
+    def wait_for_js_condition(self, expression: str, timeout: float = None) -> float:
+        """Wait until a JavaScript expression evaluates truthy in the page."""
+        timeout_ms = (timeout or self.timeout) * 1000
+        return self._run(expression, _JS_CONDITION_SCRIPT, expression, timeout_ms)
+
+    def watch_attribute(self, selector: str, attribute: str, operator: str, threshold: float,
+                        start_selector: str = None, stop_selector: str = None,
+                        timeout: float = None) -> Dict[str, Any]:
+        """
+        Wait in the page until a numeric attribute crosses a threshold.
+
+        The optional start element is clicked right before observing and the
+        optional stop element in the same task as the crossing, so animated
+        widgets stop exactly at the threshold with a single round-trip.
+        Returns the attribute value at the crossing, whether the stop element
+        was clicked and the elapsed seconds.
+        """
+        if operator not in (">=", "<=", ">", "<", "=="):
+            raise ValueError(f"Unsupported operator: {operator}")
+        timeout = timeout or self.timeout
+        previous_timeout = None
+        if timeout >= DEFAULT_SCRIPT_TIMEOUT:
+            # Pooled drivers are reused, so the longer timeout must not outlive this call
+            previous_timeout = self.driver.timeouts.script
+            self.driver.set_script_timeout(timeout + 5)
+
+        try:
+            result = self.driver.execute_async_script(
+                _ATTRIBUTE_WATCH_SCRIPT, selector, attribute, operator, threshold,
+                start_selector, stop_selector, timeout * 1000
+            )
+        finally:
+            if previous_timeout is not None:
+                self.driver.set_script_timeout(previous_timeout)
+        result["elapsed"] = result["elapsed"] / 1000
+        condition = f"{selector}[{attribute}] {operator} {threshold}"
+        if not result["satisfied"]:
+            raise TimeoutException(result.get("error") or f"Condition '{condition}' not met within {timeout} seconds")
+        logger.debug(f"Waited {result['elapsed']:.3f}s for {condition}, value {result['value']}")
+        return result
+
+    def wait_for_window_count(self, count: int, timeout: float = None) -> float:
+        """Wait until at least the given number of windows are open."""
+        start = time.perf_counter()
+        WebDriverWait(self.driver, timeout or self.timeout, poll_frequency=0.05).until(
+            lambda driver: len(driver.window_handles) >= count,
+            f"Expected at least {count} windows"
+        )
+        elapsed = time.perf_counter() - start
+        logger.debug(f"Waited {elapsed:.3f}s for {count} windows")
+        return elapsed